@@ -131,7 +131,7 @@ from src.core.generation_phases import (
     postprocess_all_batches
 )
 from src.utils.debug import Debug
-from src.optimization.memory_manager import clear_memory, get_gpu_backend, is_cuda_available
+from src.optimization.memory_manager import clear_memory, get_gpu_backend, is_cuda_available, to_pageable_tensor
 debug = Debug(enabled=False)  # Will be enabled via --debug CLI flag
 
 
@@ -868,7 +868,8 @@ def _process_frames_core(
         ctx = runner_cache['ctx']
         # Clear previous run data but keep device config
         keys_to_keep = {'dit_device', 'vae_device', 'dit_offload_device', 
-                       'vae_offload_device', 'tensor_offload_device', 'compute_dtype'}
+                       'vae_offload_device', 'tensor_offload_device', 'keep_output_on_device',
+                       'compute_dtype'}
         for key in list(ctx.keys()):
             if key not in keys_to_keep:
                 del ctx[key]
@@ -879,6 +880,7 @@ def _process_frames_core(
             dit_offload_device=dit_offload,
             vae_offload_device=vae_offload,
             tensor_offload_device=tensor_offload,
+            keep_output_on_device=args.keep_output_on_device,
             debug=debug
         )
         if runner_cache is not None:
@@ -1002,12 +1004,15 @@ def _process_frames_core(
     )
     
     result_tensor = ctx['final_video']
+    ctx['final_video'] = None
     
     # Convert to CPU and compatible dtype
-    if result_tensor.is_cuda or result_tensor.is_mps:
-        result_tensor = result_tensor.cpu()
+    # No-op for CPU tensors; kept blocking since the result is read right away
+    result_tensor = result_tensor.to('cpu')
     if result_tensor.dtype in (torch.bfloat16, torch.float8_e4m3fn, torch.float8_e5m2):
         result_tensor = result_tensor.to(torch.float32)
+    # The cast above already yields pageable memory; only an uncast pinned output is copied
+    result_tensor = to_pageable_tensor(result_tensor)
     
     return result_tensor
 
@@ -1416,6 +1421,9 @@ Examples:
                         help="VAE offload device when idle: 'none', 'cpu', or GPU ID. Frees VRAM between phases. Default: none")
     device_group.add_argument("--tensor_offload_device", type=str, default="cpu",
                         help="Intermediate tensor storage: 'cpu' (recommended), 'none' (keep on GPU), or GPU ID. Default: cpu")
+    device_group.add_argument("--keep_output_on_device", action="store_true",
+                        help="Keep the assembled output video on the GPU until the end. Only with --tensor_offload_device none "
+                             "and when it fits in half the free VRAM; competes with decoding and color correction for VRAM")
     
     # Memory Optimization (BlockSwap)
     blockswap_group = parser.add_argument_group('Memory optimization (BlockSwap)')
@@ -21,7 +21,8 @@ def process_alpha_for_batch(
     rgb_original: torch.Tensor,
     device: torch.device,
     compute_dtype: torch.dtype,
-    debug: Optional['Debug'] = None
+    debug: Optional['Debug'] = None,
+    alpha_only: bool = False
 ) -> List[torch.Tensor]:
     """
     Process Alpha channel for an entire batch with temporal consistency.
@@ -34,9 +35,11 @@ def process_alpha_for_batch(
         device: Target device for processing (typically CUDA)
         compute_dtype: Pipeline compute dtype (e.g., bfloat16) for final output.
         debug: Debug instance for logging
+        alpha_only: If True, return only the upscaled Alpha (T, 1, H, W) per sample
+                    instead of concatenating a new RGBA tensor
         
     Returns:
-        List of RGBA samples with Alpha merged, in compute_dtype
+        List of RGBA samples with Alpha merged (or Alpha only), in compute_dtype
     """
     # Move alpha and RGB guidance tensors to processing device (GPU)
     alpha_original = manage_tensor(
@@ -104,12 +107,16 @@ def process_alpha_for_batch(
                 indent_level=1
             )
         
-        # Concatenate RGB and upscaled alpha to create RGBA output (T, 4, H, W)
-        rgba_sample = torch.cat([rgb_sample_4d[:, :3, :, :], alpha_upscaled], dim=1)
+        if alpha_only:
+            # Caller writes Alpha into its own RGBA storage - skip the concatenation copy
+            rgba_sample = alpha_upscaled
+        else:
+            # Concatenate RGB and upscaled alpha to create RGBA output (T, 4, H, W)
+            rgba_sample = torch.cat([rgb_sample_4d[:, :3, :, :], alpha_upscaled], dim=1)
         
         # Restore original format
         if was_single_frame:
-            rgba_sample = rgba_sample.squeeze(0)  # (1, 4, H, W) -> (4, H, W)
+            rgba_sample = rgba_sample.squeeze(0)  # (1, C, H, W) -> (C, H, W)
         
         processed_samples.append(rgba_sample)
         
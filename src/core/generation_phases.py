@@ -25,6 +25,7 @@ Key Features:
 
 import os
 import torch
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Any, Callable
 
 from .generation_utils import (
@@ -47,10 +48,17 @@ from ..optimization.memory_manager import (
     cleanup_dit,
     cleanup_vae,
     cleanup_text_embeddings,
+    allocate_host_tensor,
+    copy_to_host_async,
+    get_basic_vram_info,
     manage_tensor,
     manage_model_device,
+    prefetch_tensor,
+    recycle_host_tensor,
     release_tensor_memory,
-    release_tensor_collection
+    release_tensor_collection,
+    synchronize_offload_streams,
+    wait_for_prefetch
 )
 from ..optimization.performance import (
     optimized_video_rearrange, 
@@ -66,6 +74,27 @@ from ..utils.color_fix import (
 )
 
 
+@dataclass
+class BatchRecord:
+    """
+    Per-batch state carried across the four generation phases.
+    
+    Replaces parallel per-field lists in ctx: each phase reads and releases the
+    fields of a single record instead of indexing several lists.
+    """
+    latent: Optional[torch.Tensor] = None  # Encoded latent (Phase 1 → Phase 2)
+    upscaled_latent: Optional[torch.Tensor] = None  # Upscaled latent (Phase 2 → Phase 3)
+    ori_length: Optional[int] = None  # Frame count before temporal padding
+    metadata: Optional[Tuple[int, int, int]] = None  # (start_idx, end_idx, uniform_padding) for reconstruction
+    alpha: Optional[torch.Tensor] = None  # Alpha channel for RGBA inputs
+    rgb: Optional[torch.Tensor] = None  # Original RGB edge guidance for RGBA inputs
+    
+    def release(self) -> None:
+        """Release all tensor memory held by this record."""
+        release_tensor_collection([self.latent, self.upscaled_latent, self.alpha, self.rgb])
+        self.latent = self.upscaled_latent = self.alpha = self.rgb = None
+
+
 def _prepare_video_batch(
     images: torch.Tensor,
     start_idx: int,
@@ -95,7 +124,8 @@ def _prepare_video_batch(
     if uniform_padding > 0:
         if log_info and debug:
             current_frames = end_idx - start_idx
-            debug.log(f"Sequence of {current_frames} frames", category="video", force=True, indent_level=1)
+            if debug.enabled:
+                debug.log(f"Sequence of {current_frames} frames", category="video", indent_level=1)
             debug.log(f"Padding batch: {uniform_padding} frame{'s' if uniform_padding != 1 else ''} added ({current_frames} → {current_frames + uniform_padding}) for uniform batches", 
                      category="video", force=True, indent_level=1)
         video = pad_video_temporal(video, count=uniform_padding, temporal_dim=0, prepend=False, debug=None)
@@ -106,22 +136,92 @@ def _prepare_video_batch(
     return video
 
 
-def _apply_4n1_padding(video: torch.Tensor) -> torch.Tensor:
+def _apply_4n1_padding(video: torch.Tensor, buffer: Optional[torch.Tensor] = None) -> torch.Tensor:
     """
     Apply 4n+1 temporal padding constraint required by VAE.
     
     Args:
         video: Video tensor in TCHW format
+        buffer: Optional preallocated TCHW buffer to write the padded frames into.
+                Used when it matches video's device, dtype and CHW shape and has
+                enough frames; otherwise a new tensor is allocated.
         
     Returns:
-        Padded video in TCHW format
+        Padded video in TCHW format (a view of buffer when it was used)
     """
     t = video.size(0)
-    if t % 4 != 1:
-        video = optimized_single_video_rearrange(video)  # TCHW -> CTHW
-        video = pad_video_temporal(video, temporal_dim=1, prepend=False, debug=None)
-        video = optimized_single_video_rearrange(video)  # CTHW -> TCHW
-    return video
+    if t % 4 == 1:
+        return video
+    
+    target = ((t - 1) // 4 + 1) * 4 + 1
+    count = target - t
+    if (buffer is not None and count < t and buffer.size(0) >= target
+            and buffer.shape[1:] == video.shape[1:]
+            and buffer.dtype == video.dtype and buffer.device == video.device):
+        # Same frames as pad_video_temporal (reflected tail), written in place
+        padded = buffer[:target]
+        padded[:t].copy_(video)
+        padded[t:].copy_(video[t - count - 1:t - 1].flip(0))
+        return padded
+    
+    # Pad along T directly (no CTHW round-trip, output stays contiguous TCHW)
+    return pad_video_temporal(video, temporal_dim=0, prepend=False, debug=None)
+
+
+def _count_encode_batches(total_frames: int, step: int, temporal_overlap: int) -> int:
+    """
+    Count encoding batches without iterating over batch start indices.
+    
+    Matches the encoding loop: a batch starts every `step` frames, and batches
+    after the first are dropped once their remaining frames (total_frames - start)
+    are fully covered by the temporal overlap.
+    
+    Args:
+        total_frames: Total number of frames to encode
+        step: Frames between batch starts (batch_size - temporal_overlap)
+        temporal_overlap: Overlapping frames between consecutive batches
+        
+    Returns:
+        Number of batches the encoding loop will process
+    """
+    if total_frames <= 0:
+        return 0
+    # Starts k*step (k >= 1) are kept while k*step < total_frames - temporal_overlap
+    return max(1, -(-(total_frames - temporal_overlap) // step))
+
+
+def _stash_alpha_and_rgb(
+    record: BatchRecord,
+    video: torch.Tensor,
+    offload_device: Optional[torch.device],
+    encode_idx: int,
+    debug: 'Debug'
+) -> None:
+    """
+    Store Alpha and RGB edge guidance of a padded RGBA batch for Phase 4.
+    
+    Args:
+        record: Batch record receiving the stashed tensors
+        video: Padded RGBA video in TCHW format (T, 4, H, W)
+        offload_device: Device to offload the stash to (None = keep on current device)
+        encode_idx: Batch index for logging
+        debug: Debug instance for logging
+    """
+    # Store on tensor_offload_device to save VRAM (or keep on device if none).
+    # A single transfer of the full RGBA tensor; Alpha and RGB are views into it.
+    if offload_device is not None:
+        video = manage_tensor(
+            tensor=video,
+            target_device=offload_device,
+            tensor_name=f"rgba_original_{encode_idx+1}",
+            non_blocking=True,
+            debug=debug,
+            reason="storing Alpha channel and RGB edge guidance for upscaling",
+            indent_level=1
+        )
+    
+    record.alpha = video[:, 3:4, :, :]
+    record.rgb = video[:, :3, :, :]
 
 
 def _reconstruct_and_transform_batch(
@@ -133,14 +233,14 @@ def _reconstruct_and_transform_batch(
     Reconstruct and transform a video batch for color correction (Phase 4).
     
     Args:
-        ctx: Context with input_images, batch_metadata, video_transform
+        ctx: Context with input_images, batches, video_transform
         batch_idx: Index of batch to reconstruct
         debug: Debug instance for logging
         
     Returns:
         Transformed video in CTHW format, ready for color correction
     """
-    start_idx, end_idx, uniform_padding = ctx['batch_metadata'][batch_idx]
+    start_idx, end_idx, uniform_padding = ctx['batches'][batch_idx].metadata
     
     # Prepare video batch
     video = _prepare_video_batch(
@@ -152,6 +252,18 @@ def _reconstruct_and_transform_batch(
         log_info=False
     )
     
+    # Transform on the VAE device in compute dtype, exactly as in Phase 1, so the
+    # reference stays on GPU for color correction instead of resizing on CPU
+    video = manage_tensor(
+        tensor=video,
+        target_device=ctx['vae_device'],
+        tensor_name=f"reference_batch_{batch_idx+1}",
+        dtype=ctx['compute_dtype'],
+        debug=debug,
+        reason="color correction reference",
+        indent_level=1
+    )
+    
     # Apply 4n+1 padding using shared helper
     video = _apply_4n1_padding(video)
     
@@ -208,8 +320,8 @@ def encode_all_batches(
         
     Returns:
         dict: Context containing:
-            - batch_metadata: Lightweight indices for on-demand transform reconstruction
-            - all_latents: List of encoded latents ready for upscaling
+            - batches: List of BatchRecord with encoded latents ready for upscaling,
+              original lengths, reconstruction indices and Alpha/RGB stashes
             - Other state for subsequent phases
             
     Raises:
@@ -278,24 +390,29 @@ def encode_all_batches(
     ctx['actual_temporal_overlap'] = temporal_overlap
     
     # Calculate number of batches
-    num_encode_batches = 0
-    for idx in range(0, total_frames, step):
-        end_idx = min(idx + batch_size, total_frames)
-        if idx > 0 and end_idx - idx <= temporal_overlap:
-            break
-        num_encode_batches += 1
-    
-    # Pre-allocate lists for memory efficiency
-    ctx['all_latents'] = [None] * num_encode_batches
-    ctx['all_ori_lengths'] = [None] * num_encode_batches
-    if color_correction != "none":
-        ctx['batch_metadata'] = [None] * num_encode_batches
+    num_encode_batches = _count_encode_batches(total_frames, step, temporal_overlap)
+    
+    # Pre-allocate one record per batch
+    batches = [BatchRecord() for _ in range(num_encode_batches)]
+    ctx['batches'] = batches
+    
+    # Loop-invariant flags, resolved once instead of per batch
+    is_rgba = ctx['is_rgba']
+    store_metadata = color_correction != "none"
+    tensor_offload_device = ctx['tensor_offload_device']
+    vae_device = ctx['vae_device']
+    compute_dtype = ctx['compute_dtype']
+    video_transform = ctx['video_transform']
+    
+    # Lazily allocated 4n+1 padding buffer, sized for the largest padded batch
+    max_padded_frames = ((batch_size - 1) // 4 + 1) * 4 + 1
+    pad_buffer = None
     
     encode_idx = 0
     
     try:
-        # Materialize VAE if still on meta device
-        if runner.vae and next(runner.vae.parameters()).device.type == 'meta':
+        # Materialize VAE if still on meta device (flag set by materialize_model)
+        if runner.vae and not getattr(runner.vae, '_materialized', False):
             materialize_model(runner, "vae", ctx['vae_device'], runner.config, debug)
         else:
             # Model already materialized (cached) - apply any pending configs if needed
@@ -379,9 +496,9 @@ def encode_all_batches(
             
             video = manage_tensor(
                 tensor=video,
-                target_device=ctx['vae_device'],
+                target_device=vae_device,
                 tensor_name=f"video_batch_{encode_idx+1}",
-                dtype=ctx['compute_dtype'],
+                dtype=compute_dtype,
                 debug=debug,
                 reason="VAE encoding",
                 indent_level=1
@@ -390,9 +507,10 @@ def encode_all_batches(
             # Check temporal dimension for 4n+1 padding
             t = video.size(0)
             
-            # Log sequence size if not already logged (for non-uniform batches)
-            if not is_uniform_padding:
-                debug.log(f"Sequence of {t} frames", category="video", force=True, indent_level=1)
+            # Log sequence size if not already logged (for non-uniform batches).
+            # Per-batch detail, not progress: only formatted when debug is enabled
+            if debug.enabled and not is_uniform_padding:
+                debug.log(f"Sequence of {t} frames", category="video", indent_level=1)
 
             # Apply 4n+1 padding using shared helper
             if t % 4 != 1:
@@ -400,17 +518,35 @@ def encode_all_batches(
                 padding_frames = target - t
                 debug.log(f"Padding batch: {padding_frames} frame{'s' if padding_frames != 1 else ''} added ({t} → {target}) to meet 4n+1 constraint", 
                          category="video", force=True, indent_level=1)
+                # Reuse one padded buffer across batches. RGBA batches are excluded
+                # because their alpha/RGB stash may still reference or read the frames.
+                if not is_rgba and pad_buffer is None:
+                    pad_buffer = torch.empty(
+                        (max_padded_frames,) + tuple(video.shape[1:]),
+                        dtype=video.dtype, device=video.device
+                    )
                 # Apply 4n+1 padding to match exact frame count from encoding
-                video = _apply_4n1_padding(video)
+                video = _apply_4n1_padding(video, buffer=pad_buffer)
+
+            record = batches[encode_idx]
+            
+            # Store original length for proper trimming later
+            record.ori_length = ori_length
+
+            # Store batch frame indices for on-demand reconstruction
+            if store_metadata:
+                record.metadata = (start_idx, end_idx, batch_size - ori_length if is_uniform_padding else 0)
 
             # Apply transformations (matches reconstruction logic)
-            if ctx.get('is_rgba', False):
+            if is_rgba:
                 debug.log(f"Extracted Alpha channel for edge-guided upscaling", category="alpha", indent_level=1)
                 rgb_video = video[:, :3, :, :]
+                # Store Alpha and RGB from padded original video (before encoding)
+                _stash_alpha_and_rgb(record, video, tensor_offload_device, encode_idx, debug)
             else:
                 rgb_video = video
 
-            transformed_video = ctx['video_transform'](rgb_video)
+            transformed_video = video_transform(rgb_video)
 
             # Apply input noise if requested (to reduce artifacts at high resolutions)
             if input_noise_scale > 0:
@@ -418,68 +554,24 @@ def encode_all_batches(
                 
                 # Generate noise matching the video shape
                 noise = torch.randn_like(transformed_video)
-                
-                # Subtle noise amplitude
-                noise = noise * 0.05
-                
+
                 # Linear blend factor: 0 at scale=0, 0.5 at scale=1
                 blend_factor = input_noise_scale * 0.5
-                
-                # Apply blend
-                transformed_video = transformed_video * (1 - blend_factor) + (transformed_video + noise) * blend_factor
-                
-                del noise
 
-            # Store original length for proper trimming later
-            ctx['all_ori_lengths'][encode_idx] = ori_length
+                # Blend x*(1-b) + (x + 0.05*noise)*b simplifies to x + b*0.05*noise,
+                # applied in-place to avoid full-size intermediates
+                transformed_video.add_(noise, alpha=blend_factor * 0.05)
 
-            # Store batch frame indices for on-demand reconstruction
-            if color_correction != "none":
-                ctx['batch_metadata'][encode_idx] = (start_idx, end_idx, batch_size - ori_length if is_uniform_padding else 0)
-            
-            # Extract and store Alpha and RGB from padded original video (before encoding)
-            if ctx.get('is_rgba', False):
-                if 'all_alpha_channels' not in ctx:
-                    ctx['all_alpha_channels'] = [None] * num_encode_batches
-                if 'all_input_rgb' not in ctx:
-                    ctx['all_input_rgb'] = [None] * num_encode_batches
-                
-                # Extract from padded RGBA video (format: T, 4, H, W)
-                alpha_channel = video[:, 3:4, :, :]
-                rgb_video_original = video[:, :3, :, :]
-                
-                # Store on tensor_offload_device to save VRAM (or keep on device if none)
-                if ctx['tensor_offload_device'] is not None:
-                    ctx['all_alpha_channels'][encode_idx] = manage_tensor(
-                        tensor=alpha_channel,
-                        target_device=ctx['tensor_offload_device'],
-                        tensor_name=f"alpha_channel_{encode_idx+1}",
-                        debug=debug,
-                        reason="storing Alpha channel for upscaling",
-                        indent_level=1
-                    )
-                    ctx['all_input_rgb'][encode_idx] = manage_tensor(
-                        tensor=rgb_video_original,
-                        target_device=ctx['tensor_offload_device'],
-                        tensor_name=f"rgb_original_{encode_idx+1}",
-                        debug=debug,
-                        reason="storing RGB edge guidance for Alpha upscaling",
-                        indent_level=1
-                    )
-                else:
-                    ctx['all_alpha_channels'][encode_idx] = alpha_channel
-                    ctx['all_input_rgb'][encode_idx] = rgb_video_original
-                
-                del alpha_channel, rgb_video_original
+                del noise
 
             del video
 
             # Move to VAE device with correct dtype for encoding
             transformed_video = manage_tensor(
                 tensor=transformed_video,
-                target_device=ctx['vae_device'],
+                target_device=vae_device,
                 tensor_name=f"transformed_video_{encode_idx+1}",
-                dtype=ctx['compute_dtype'],
+                dtype=compute_dtype,
                 debug=debug,
                 reason="VAE encoding",
                 indent_level=1
@@ -492,29 +584,30 @@ def encode_all_batches(
             del transformed_video, rgb_video
             
             # Convert from VAE dtype to compute dtype and offload to avoid VRAM accumulation
-            if ctx['tensor_offload_device'] is not None and (cond_latents[0].is_cuda or cond_latents[0].is_mps):
-                ctx['all_latents'][encode_idx] = manage_tensor(
+            if tensor_offload_device is not None and (cond_latents[0].is_cuda or cond_latents[0].is_mps):
+                record.latent = manage_tensor(
                     tensor=cond_latents[0],
-                    target_device=ctx['tensor_offload_device'],
+                    target_device=tensor_offload_device,
                     tensor_name=f"latent_{encode_idx+1}",
-                    dtype=ctx['compute_dtype'],
+                    dtype=compute_dtype,
+                    non_blocking=True,
                     debug=debug,
                     reason="storing encoded latents for upscaling",
                     indent_level=1
                 )
             else:
                 # Stay on current device but convert to compute dtype
-                ctx['all_latents'][encode_idx] = manage_tensor(
+                record.latent = manage_tensor(
                     tensor=cond_latents[0],
                     target_device=cond_latents[0].device,
                     tensor_name=f"latent_{encode_idx+1}",
-                    dtype=ctx['compute_dtype'],
+                    dtype=compute_dtype,
                     debug=debug,
                     reason="VAE dtype → compute dtype",
                     indent_level=1
                 )
             
-            del cond_latents
+            del cond_latents, record
             
             debug.end_timer(f"encode_batch_{encode_idx+1}", f"Encoded batch {encode_idx+1}")
             
@@ -528,6 +621,12 @@ def encode_all_batches(
         debug.log(f"Error in Phase 1 (Encoding): {e}", level="ERROR", category="error", force=True)
         raise
     finally:
+        # Complete pending asynchronous offloads (Alpha/RGB stashes) before leaving the phase
+        synchronize_offload_streams()
+        
+        # Drop the padding buffer
+        pad_buffer = None
+        
         # Offload VAE to configured offload device if specified
         if ctx['vae_offload_device'] is not None:
             manage_model_device(model=runner.vae, target_device=ctx['vae_offload_device'], 
@@ -568,7 +667,7 @@ def upscale_all_batches(
         
     Returns:
         dict: Updated context containing:
-            - all_upscaled_latents: List of upscaled latents ready for decoding
+            - batches: Records updated with upscaled latents ready for decoding
             - Preserved state from encoding phase
             
     Raises:
@@ -582,7 +681,7 @@ def upscale_all_batches(
         raise ValueError("Context is required for upscale_all_batches. Run encode_all_batches first.")
         
     # Validate we have encoded latents
-    if 'all_latents' not in ctx or not ctx['all_latents']:
+    if not ctx.get('batches') or all(record.latent is None for record in ctx['batches']):
         raise ValueError("No encoded latents found. Run encode_all_batches first.")
     
     debug.log("", category="none", force=True)
@@ -602,22 +701,13 @@ def upscale_all_batches(
     runner.configure_diffusion(device=ctx['dit_device'], dtype=ctx['compute_dtype'])
 
     # Count valid latents
-    num_valid_latents = len([l for l in ctx['all_latents'] if l is not None])
-
-    # Safety check for empty latents
-    if num_valid_latents == 0:
-        debug.log("No valid latents to upscale", level="WARNING", category="dit", force=True)
-        ctx['all_upscaled_latents'] = []
-        return ctx
-    
-    # Pre-allocate list for upscaled latents
-    ctx['all_upscaled_latents'] = [None] * num_valid_latents
+    num_valid_latents = sum(1 for record in ctx['batches'] if record.latent is not None)
     
     upscale_idx = 0
     
     try:
-        # Materialize DiT if still on meta device
-        if runner.dit and next(runner.dit.parameters()).device.type == 'meta':
+        # Materialize DiT if still on meta device (flag set by materialize_model)
+        if runner.dit and not getattr(runner.dit, '_materialized', False):
             materialize_model(runner, "dit", ctx['dit_device'], runner.config, debug)
         else:
             # Model already materialized (cached) - apply any pending configs if needed
@@ -651,51 +741,96 @@ def upscale_all_batches(
 
         debug.log_memory_state("After DiT loading for upscaling", detailed_tensors=False)
 
-        for batch_idx, latent in enumerate(ctx['all_latents']):
-            if latent is None:
-                continue
-            
+        # Loop-invariant device/dtype, resolved once instead of per batch
+        dit_device = ctx['dit_device']
+        compute_dtype = ctx['compute_dtype']
+        use_mps = dit_device.type == 'mps'
+        
+        # Detect DiT model dtype once (handle CompatibleDiT wrapper); weights keep their
+        # dtype for the whole phase, so the autocast decision is loop-invariant
+        dit_model = runner.dit.dit_model if hasattr(runner.dit, 'dit_model') else runner.dit
+        try:
+            dit_dtype = next(dit_model.parameters()).dtype
+        except StopIteration:
+            dit_dtype = compute_dtype  # Fallback for meta device or empty model
+        # Use autocast if DiT dtype differs from compute dtype
+        # Skip autocast on MPS (CompatibleDiT already handles dtype conversion)
+        use_autocast = dit_dtype != compute_dtype and not use_mps
+        
+        pending = [record for record in ctx['batches'] if record.latent is not None]
+        next_latent = None
+        noise_generator = None
+        # Noise buffers recycled across batches of the same latent shape
+        noise_buffers = {}
+        
+        # Latent noise timestep, created once instead of per batch (per-shape transforms cached)
+        noise_timestep_base = None
+        noise_timesteps = {}
+        if latent_noise_scale > 0:
+            noise_timestep_base = torch.tensor([1000.0], device=dit_device, dtype=compute_dtype) * latent_noise_scale
+        
+        def _add_noise(x, aug_noise):
+            if latent_noise_scale == 0.0:
+                return x
+            # Noise timestep depends only on the latent shape: build it once per shape
+            shape_key = tuple(x.shape[1:])
+            t = noise_timesteps.get(shape_key)
+            if t is None:
+                shape = torch.tensor(shape_key, device=dit_device)[None]
+                t = runner.timestep_transform(noise_timestep_base, shape)
+                noise_timesteps[shape_key] = t
+            return runner.schedule.forward(x, aug_noise, t)
+        
+        for pending_idx, record in enumerate(pending):
             check_interrupt(ctx)
             
             debug.log(f"Upscaling batch {upscale_idx+1}/{num_valid_latents}", category="generation", force=True)
-            # Reset seed for each batch to ensure identical RNG state
-            # This ensures identical inputs produce identical outputs regardless of batch position
-            set_seed(seed)
+            # Noise generator is re-seeded per batch (below) so identical inputs produce
+            # identical outputs regardless of batch position; global RNGs are left untouched
             debug.log(f"Using seed: {seed} for deterministic generation", category="dit")
 
             debug.start_timer(f"upscale_batch_{upscale_idx+1}")
             
+            # Use the latent prefetched during the previous batch, if any
+            latent = wait_for_prefetch(next_latent) if next_latent is not None else record.latent
+            next_latent = None
+            
             # Move to DiT device with correct dtype for upscaling (no-op if already there)
             latent = manage_tensor(
                 tensor=latent,
-                target_device=ctx['dit_device'],
+                target_device=dit_device,
                 tensor_name=f"latent_{upscale_idx+1}",
-                dtype=ctx['compute_dtype'],
+                dtype=compute_dtype,
                 debug=debug,
                 reason="DiT upscaling",
                 indent_level=1
             )
+            
+            # Start the next batch's host → device copy so it overlaps with this batch's inference
+            if pending_idx + 1 < len(pending):
+                next_latent = prefetch_tensor(pending[pending_idx + 1].latent, dit_device, compute_dtype)
 
-            # Generate noise (randn_like automatically uses latent's device)
-            base_noise = torch.randn_like(latent, dtype=ctx['compute_dtype'])
+            # Generate noise from a dedicated generator on the latent's device, re-seeded per
+            # batch: same values as the seeded default generator, without touching global state
+            if noise_generator is None:
+                noise_generator = torch.Generator(device=latent.device)
+            noise_generator.manual_seed(seed)
+            buffers = noise_buffers.get(latent.shape)
+            if buffers is None:
+                buffers = (torch.empty_like(latent, dtype=compute_dtype),
+                           torch.empty_like(latent, dtype=compute_dtype))
+                noise_buffers[latent.shape] = buffers
+            base_noise = buffers[0].normal_(generator=noise_generator)
             
             noises = [base_noise]
-            aug_noises = [base_noise * 0.1 + torch.randn_like(base_noise) * 0.05]
+            # base_noise * 0.1 + randn * 0.05, built in place in a single buffer
+            aug_noise = buffers[1].normal_(generator=noise_generator).mul_(0.05).add_(base_noise, alpha=0.1)
+            aug_noises = [aug_noise]
             
             # Log latent noise application if enabled
             if latent_noise_scale > 0:
                 debug.log(f"Applying latent noise (scale: {latent_noise_scale:.3f})", category="generation")
             
-            def _add_noise(x, aug_noise):
-                if latent_noise_scale == 0.0:
-                    return x
-                t = torch.tensor([1000.0], device=ctx['dit_device'], dtype=ctx['compute_dtype']) * latent_noise_scale
-                shape = torch.tensor(x.shape[1:], device=ctx['dit_device'])[None]
-                t = runner.timestep_transform(t, shape)
-                x = runner.schedule.forward(x, aug_noise, t)
-                del t, shape
-                return x
-            
             # Generate condition
             condition = runner.get_condition(
                 noises[0],
@@ -704,19 +839,10 @@ def upscale_all_batches(
             )
             conditions = [condition]
             
-            # Detect DiT model dtype (handle CompatibleDiT wrapper)
-            dit_model = runner.dit.dit_model if hasattr(runner.dit, 'dit_model') else runner.dit
-            try:
-                dit_dtype = next(dit_model.parameters()).dtype
-            except StopIteration:
-                dit_dtype = ctx['compute_dtype']  # Fallback for meta device or empty model
-            
-            # Use autocast if DiT dtype differs from compute dtype
-            # Skip autocast on MPS (CompatibleDiT already handles dtype conversion)
             debug.start_timer(f"dit_inference_{upscale_idx+1}")
             with torch.no_grad():
-                if dit_dtype != ctx['compute_dtype'] and ctx['dit_device'].type != 'mps':
-                    with torch.autocast(ctx['dit_device'].type, ctx['compute_dtype'], enabled=True):
+                if use_autocast:
+                    with torch.autocast(dit_device.type, compute_dtype, enabled=True):
                         upscaled_latents = runner.inference(
                             noises=noises,
                             conditions=conditions,
@@ -732,22 +858,23 @@ def upscale_all_batches(
             
             # Offload upscaled latents to avoid VRAM accumulation
             if ctx['tensor_offload_device'] is not None and (upscaled_latents[0].is_cuda or upscaled_latents[0].is_mps):
-                ctx['all_upscaled_latents'][upscale_idx] = manage_tensor(
+                record.upscaled_latent = manage_tensor(
                     tensor=upscaled_latents[0],
                     target_device=ctx['tensor_offload_device'],
                     tensor_name=f"upscaled_latent_{upscale_idx+1}",
+                    non_blocking=True,
                     debug=debug,
                     reason="storing upscaled latents for decoding",
                     indent_level=1
                 )
             else:
-                ctx['all_upscaled_latents'][upscale_idx] = upscaled_latents[0]
+                record.upscaled_latent = upscaled_latents[0]
             
-            # Free original latent - release tensor memory first
-            release_tensor_memory(ctx['all_latents'][batch_idx])
-            ctx['all_latents'][batch_idx] = None
+            # Free original latent - pinned host buffers go back to the offload pool
+            recycle_host_tensor(record.latent)
+            record.latent = None
             
-            del noises, aug_noises, latent, conditions, condition, base_noise, upscaled_latents
+            del noises, aug_noises, aug_noise, latent, conditions, condition, base_noise, buffers, upscaled_latents
             
             debug.end_timer(f"upscale_batch_{upscale_idx+1}", f"Upscaled batch {upscale_idx+1}")
             
@@ -761,6 +888,10 @@ def upscale_all_batches(
         debug.log(f"Error in Phase 2 (Upscaling): {e}", level="ERROR", category="error", force=True)
         raise
     finally:
+        # Complete pending asynchronous offloads (upscaled latents) before leaving the phase
+        synchronize_offload_streams()
+        noise_buffers = None
+        
         # Log BlockSwap summary if it was used
         if hasattr(runner, '_blockswap_active') and runner._blockswap_active:
             swap_summary = debug.get_swap_summary()
@@ -795,8 +926,12 @@ def upscale_all_batches(
         # Cleanup DiT as it's no longer needed after upscaling
         cleanup_dit(runner=runner, debug=debug, cache_model=cache_model)
         
-        # Cleanup text embeddings as they're no longer needed after upscaling
-        cleanup_text_embeddings(ctx, debug)
+        # Cleanup text embeddings as they're no longer needed after upscaling.
+        # With a cached DiT keep them resident: load_text_embeddings reuses them next run
+        if cache_model:
+            ctx['text_embeds'] = None
+        else:
+            cleanup_text_embeddings(ctx, debug)
     
     debug.end_timer("phase2_upscaling", "Phase 2: DiT upscaling complete", show_breakdown=True)
     debug.log_memory_state("After phase 2 (DiT upscaling)", show_tensors=False)
@@ -844,7 +979,7 @@ def decode_all_batches(
         raise ValueError("Context is required for decode_all_batches. Run upscale_all_batches first.")
     
     # Validate we have upscaled latents
-    if 'all_upscaled_latents' not in ctx or not ctx['all_upscaled_latents']:
+    if not ctx.get('batches') or all(record.upscaled_latent is None for record in ctx['batches']):
         raise ValueError("No upscaled latents found. Run upscale_all_batches first.")
     
     debug.log("", category="none", force=True)
@@ -852,8 +987,7 @@ def decode_all_batches(
     debug.start_timer("phase3_decoding")
 
     # Count valid latents
-    num_valid_latents = len([l for l in ctx['all_upscaled_latents'] if l is not None])
-    num_batches = len([l for l in ctx['all_ori_lengths'] if l is not None])
+    num_valid_latents = sum(1 for record in ctx['batches'] if record.upscaled_latent is not None)
     
     # Get output dimensions from context (set during Phase 1)
     if 'true_target_dims' not in ctx:
@@ -865,18 +999,32 @@ def decode_all_batches(
     # Pre-allocate final_video at the START of decode phase (before any batch processing)
     # This ensures we only need memory for final_video + 1 batch, not final_video + all batch_samples
     # MPS: keep on device (unified memory, no benefit to CPU offload)
+    # Opt-in (keep_output_on_device, only without tensor offload): keep on the CUDA VAE device when it
+    # fits in half the free VRAM, removing the device → host → device round-trip of every batch in
+    # Phases 3-4. Off by default: free VRAM measured here does not cover decode and color-fix peaks
+    required_gb = (total_frames * true_h * true_w * C * 2) / (1024**3)
     if ctx['tensor_offload_device'] is not None:
         target_device = ctx['tensor_offload_device']
     elif ctx['vae_device'].type == 'mps':
         target_device = ctx['vae_device']
     else:
         target_device = 'cpu'
+        if ctx.get('keep_output_on_device', False) and ctx['vae_device'].type == 'cuda':
+            vram_info = get_basic_vram_info(ctx['vae_device'])
+            if "error" not in vram_info and required_gb <= vram_info["free_gb"] * 0.5:
+                target_device = ctx['vae_device']
     channels_str = "RGBA" if C == 4 else "RGB"
-    required_gb = (total_frames * true_h * true_w * C * 2) / (1024**3)
     debug.log(f"Pre-allocating output tensor: {total_frames} frames, {true_w}x{true_h}px, {channels_str} ({required_gb:.2f}GB)", 
               category="setup", force=True)
     
-    ctx['final_video'] = torch.empty((total_frames, true_h, true_w, C), dtype=ctx['compute_dtype'], device=target_device)
+    # Layout: contiguous [T, H, W, C] is already channels_last storage for the [T, C, H, W]
+    # views taken in Phase 4, and is what ComfyUI's IMAGE type expects. Keep whole-frame
+    # slices (final_video[a:b]) as the write targets so copies stay contiguous for DMA.
+    if str(target_device) == 'cpu':
+        # Pinned when it fits; larger outputs stay pageable and stream through pinned staging slots
+        ctx['final_video'] = allocate_host_tensor((total_frames, true_h, true_w, C), ctx['compute_dtype'])
+    else:
+        ctx['final_video'] = torch.empty((total_frames, true_h, true_w, C), dtype=ctx['compute_dtype'], device=target_device)
     
     # Track batch write positions for Phase 4 processing
     # Each entry: (write_start, write_end, batch_idx, ori_length)
@@ -893,7 +1041,7 @@ def decode_all_batches(
     
     try:
         # VAE should already be materialized from encoding phase
-        if runner.vae and next(runner.vae.parameters()).device.type == 'meta':
+        if runner.vae and not getattr(runner.vae, '_materialized', False):
             materialize_model(runner, "vae", ctx['vae_device'], runner.config, debug)
 
         # Precision should already be initialized from encoding phase
@@ -912,15 +1060,20 @@ def decode_all_batches(
             debug.log("Remember to disable --tile_debug in production to remove overlay visualization", category="tip", indent_level=1, force=True)
         
         # Process decoding
-        for batch_idx, upscaled_latent in enumerate(ctx['all_upscaled_latents']):
-            if upscaled_latent is None:
-                continue
-            
+        pending = [(batch_idx, record) for batch_idx, record in enumerate(ctx['batches'])
+                   if record.upscaled_latent is not None]
+        next_latent = None
+        
+        for pending_idx, (batch_idx, record) in enumerate(pending):
             check_interrupt(ctx)
             
             debug.log(f"Decoding batch {decode_idx+1}/{num_valid_latents}", category="vae", force=True)
             debug.start_timer(f"decode_batch_{decode_idx+1}")
             
+            # Use the latent prefetched during the previous batch, if any
+            upscaled_latent = wait_for_prefetch(next_latent) if next_latent is not None else record.upscaled_latent
+            next_latent = None
+            
             # Move to VAE device with correct dtype for decoding (no-op if already there)
             upscaled_latent = manage_tensor(
                 tensor=upscaled_latent,
@@ -932,6 +1085,11 @@ def decode_all_batches(
                 indent_level=1
             )
             
+            # Start the next batch's host → device copy so it overlaps with this batch's decode
+            if pending_idx + 1 < len(pending):
+                next_latent = prefetch_tensor(pending[pending_idx + 1][1].upscaled_latent,
+                                              ctx['vae_device'], ctx['compute_dtype'])
+            
             # Decode latent
             debug.start_timer("vae_decode")
             samples = runner.vae_decode([upscaled_latent])
@@ -947,7 +1105,7 @@ def decode_all_batches(
             del samples
             
             # Get original length for this batch (before any padding was added)
-            ori_length = ctx['all_ori_lengths'][decode_idx] if decode_idx < len(ctx['all_ori_lengths']) else sample.shape[0]
+            ori_length = record.ori_length if record.ori_length is not None else sample.shape[0]
             
             # Trim temporal padding: sample is in [T, C, H, W] format after rearrange
             if ori_length < sample.shape[0]:
@@ -977,6 +1135,9 @@ def decode_all_batches(
             else:
                 # Subsequent batches with overlap: blend overlapping region
                 if temporal_overlap < batch_frames and current_write_idx >= temporal_overlap:
+                    # Previous batch may still be streaming into final_video
+                    synchronize_offload_streams()
+                    
                     # Blend overlapping region in-place on final_video
                     prev_tail = ctx['final_video'][current_write_idx - temporal_overlap:current_write_idx]
                     cur_head = sample[:temporal_overlap]
@@ -999,34 +1160,26 @@ def decode_all_batches(
                 write_start = current_write_idx
                 write_end = current_write_idx + batch_frames
             
-            # Move sample to target device and write directly to final_video
-            sample = manage_tensor(
-                tensor=sample,
-                target_device=target_device,
-                tensor_name=f"sample_{decode_idx+1}",
-                dtype=ctx['compute_dtype'],
-                debug=debug,
-                reason="writing to final_video",
-                indent_level=1
-            )
-            
-            # Write to final_video - for RGBA, write only RGB channels (VAE outputs 3 channels)
+            # Write directly into final_video: copy_ handles the device move and dtype
+            # cast in one pass, without an intermediate tensor on the target device.
+            # For RGBA, write only RGB channels (VAE outputs 3 channels)
             if ctx.get('is_rgba', False):
-                ctx['final_video'][write_start:write_end, :, :, :3] = sample
+                ctx['final_video'][write_start:write_end, :, :, :3].copy_(sample)
             else:
-                ctx['final_video'][write_start:write_end] = sample
+                # Contiguous slice: stream to pinned host memory while the next batch decodes
+                copy_to_host_async(ctx['final_video'][write_start:write_end], sample)
             
             # Store batch info for Phase 4 processing
-            ctx['decode_batch_info'].append((write_start, write_end, decode_idx, ori_length))
+            ctx['decode_batch_info'].append((write_start, write_end, batch_idx, ori_length))
             current_write_idx = write_end
             
             debug.log(f"Wrote {batch_frames} frames to positions {write_start}-{write_end}", 
                      category="video", indent_level=1)
             
             # Free memory immediately - no batch_samples storage
-            release_tensor_memory(ctx['all_upscaled_latents'][batch_idx])
-            ctx['all_upscaled_latents'][batch_idx] = None
-            del upscaled_latent, sample
+            release_tensor_memory(record.upscaled_latent)
+            record.upscaled_latent = None
+            del upscaled_latent, sample, record
             
             debug.end_timer(f"decode_batch_{decode_idx+1}", f"Decoded batch {decode_idx+1}")
             
@@ -1043,13 +1196,16 @@ def decode_all_batches(
         debug.log(f"Error in Phase 3 (Decoding): {e}", level="ERROR", category="error", force=True)
         raise
     finally:
+        # Complete pending asynchronous writes into final_video before it is read
+        synchronize_offload_streams()
+        
         # Cleanup VAE as it's no longer needed
         cleanup_vae(runner=runner, debug=debug, cache_model=cache_model)
         
         # Clean up upscaled latents storage
-        if 'all_upscaled_latents' in ctx:
-            release_tensor_collection(ctx['all_upscaled_latents'])
-            del ctx['all_upscaled_latents']
+        for record in ctx.get('batches') or []:
+            release_tensor_memory(record.upscaled_latent)
+            record.upscaled_latent = None
         
     debug.end_timer("phase3_decoding", "Phase 3: VAE decoding complete", show_breakdown=True)
     debug.log_memory_state("After phase 3 (VAE decoding)", show_tensors=False)
@@ -1124,10 +1280,8 @@ def postprocess_all_batches(
     # Calculate total post-processing work units
     # For RGBA: each batch needs 2 steps (alpha processing + color correction/assembly)
     # For RGB: each batch needs 1 step (color correction/assembly only)
-    has_alpha_processing = (ctx.get('is_rgba', False) and 
-                           'all_alpha_channels' in ctx and 
-                           'all_input_rgb' in ctx and
-                           isinstance(ctx.get('all_alpha_channels'), list))
+    batches = ctx.get('batches') or []
+    has_alpha_processing = ctx.get('is_rgba', False) and any(record.alpha is not None for record in batches)
     
     if has_alpha_processing:
         total_postprocessing_steps = num_valid_samples * 2  # Alpha + main processing
@@ -1144,79 +1298,61 @@ def postprocess_all_batches(
     if has_alpha_processing:
         debug.log("Processing Alpha channel with edge-guided upscaling...", category="alpha")
         
-        # Validate alpha channel data exists
-        if not isinstance(ctx.get('all_alpha_channels'), list) or not isinstance(ctx.get('all_input_rgb'), list):
-            debug.log("WARNING: Alpha channel data malformed, skipping alpha processing", 
-                     level="WARNING", category="alpha", force=True)
-        else:
-            for write_start, write_end, batch_idx, ori_length in batch_info_list:
-                # Bounds checking for alpha channel lists
-                if batch_idx >= len(ctx['all_alpha_channels']) or ctx['all_alpha_channels'][batch_idx] is None:
-                    continue
-                    
-                # Validate alpha channel tensor integrity
-                if not isinstance(ctx['all_alpha_channels'][batch_idx], torch.Tensor):
-                    debug.log(f"WARNING: Alpha channel {batch_idx} is not a tensor, skipping", 
-                             level="WARNING", category="alpha", force=True)
-                    continue
-                
-                debug.log(f"Processing Alpha batch {batch_idx+1}/{num_valid_samples}", category="alpha", force=True)
-                debug.start_timer(f"alpha_batch_{batch_idx+1}")
+        for write_start, write_end, batch_idx, ori_length in batch_info_list:
+            record = batches[batch_idx]
+            if record.alpha is None:
+                continue
 
-                # Get RGB slice from final_video for alpha processing
-                # final_video is [T, H, W, C], process_alpha_for_batch expects list of [T, C, H, W]
-                rgb_slice = ctx['final_video'][write_start:write_end, :, :, :3]  # Only RGB
-                rgb_tchw = rgb_slice.permute(0, 3, 1, 2)  # [T, H, W, 3] → [T, 3, H, W]
-                
-                # Process Alpha and merge with RGB
-                processed_samples = process_alpha_for_batch(
-                    rgb_samples=[rgb_tchw],
-                    alpha_original=ctx['all_alpha_channels'][batch_idx],
-                    rgb_original=ctx['all_input_rgb'][batch_idx],
-                    device=ctx['vae_device'],
-                    compute_dtype=ctx['compute_dtype'],
-                    debug=debug
-                )
-                
-                # processed_samples[0] is [T, 4, H, W] (RGBA)
-                # Extract only the alpha channel and write to final_video's alpha slot
-                processed_rgba = processed_samples[0]  # [T, 4, H, W]
-                alpha_channel = processed_rgba[:, 3:4, :, :]  # [T, 1, H, W]
-                alpha_thwc = alpha_channel.permute(0, 2, 3, 1)  # [T, 1, H, W] → [T, H, W, 1]
-                
-                alpha_thwc = manage_tensor(
-                    tensor=alpha_thwc,
-                    target_device=ctx['final_video'].device,
-                    tensor_name=f"alpha_channel_{batch_idx+1}",
-                    dtype=ctx['compute_dtype'],
-                    debug=debug,
-                    reason="writing alpha channel to final_video",
-                    indent_level=1
-                )
-                
-                # Write only the alpha channel to the 4th channel slot
-                ctx['final_video'][write_start:write_end, :, :, 3:4] = alpha_thwc
-                
-                del rgb_slice, rgb_tchw, processed_samples, processed_rgba, alpha_channel, alpha_thwc
-                
-                # Free memory immediately
-                release_tensor_memory(ctx['all_alpha_channels'][batch_idx])
-                ctx['all_alpha_channels'][batch_idx] = None
+            debug.log(f"Processing Alpha batch {batch_idx+1}/{num_valid_samples}", category="alpha", force=True)
+            debug.start_timer(f"alpha_batch_{batch_idx+1}")
 
-                release_tensor_memory(ctx['all_input_rgb'][batch_idx])
-                ctx['all_input_rgb'][batch_idx] = None
-            
-                debug.end_timer(f"alpha_batch_{batch_idx+1}", f"Alpha batch {batch_idx+1}")
-                
-                # Update progress for alpha processing step
-                current_postprocessing_step += 1
-                if progress_callback:
-                    progress_callback(current_postprocessing_step, total_postprocessing_steps,
-                                    1, "Phase 4: Post-processing")
+            # Get RGB slice from final_video for alpha processing
+            # final_video is [T, H, W, C], process_alpha_for_batch expects list of [T, C, H, W]
+            rgb_slice = ctx['final_video'][write_start:write_end, :, :, :3]  # Only RGB
+            rgb_tchw = rgb_slice.permute(0, 3, 1, 2)  # [T, H, W, 3] → [T, 3, H, W]
+
+            # Process Alpha and merge with RGB
+            processed_samples = process_alpha_for_batch(
+                rgb_samples=[rgb_tchw],
+                alpha_original=record.alpha,
+                rgb_original=record.rgb,
+                device=ctx['vae_device'],
+                compute_dtype=ctx['compute_dtype'],
+                debug=debug,
+                alpha_only=True
+            )
+
+            # processed_samples[0] is the upscaled alpha [T, 1, H, W]; RGB already lives in
+            # final_video, so no RGBA tensor is built
+            alpha_channel = processed_samples[0]  # [T, 1, H, W]
+            alpha_thwc = alpha_channel.permute(0, 2, 3, 1)  # [T, 1, H, W] → [T, H, W, 1]
+
+            # Write only the alpha channel to the 4th channel slot (copy_ moves and casts in one pass)
+            ctx['final_video'][write_start:write_end, :, :, 3:4].copy_(alpha_thwc)
+
+            del rgb_slice, rgb_tchw, processed_samples, alpha_channel, alpha_thwc
+
+            # Free memory immediately
+            release_tensor_memory(record.alpha)
+            record.alpha = None
+
+            release_tensor_memory(record.rgb)
+            record.rgb = None
+
+            debug.end_timer(f"alpha_batch_{batch_idx+1}", f"Alpha batch {batch_idx+1}")
+
+            # Update progress for alpha processing step
+            current_postprocessing_step += 1
+            if progress_callback:
+                progress_callback(current_postprocessing_step, total_postprocessing_steps,
+                                1, "Phase 4: Post-processing")
 
         debug.log("Alpha processing complete for all batches", category="alpha")
     
     try:
+        # Slices are prefetched to the VAE device one batch ahead of use
+        next_sample = None
+        
         # Process each batch slice in final_video in-place
         for info_idx, (write_start, write_end, batch_idx, ori_length) in enumerate(batch_info_list):
             check_interrupt(ctx)
@@ -1224,18 +1360,25 @@ def postprocess_all_batches(
             debug.log(f"Post-processing batch {info_idx+1}/{num_valid_samples}", category="video", force=True)
             debug.start_timer(f"postprocess_batch_{info_idx+1}")
             
-            # Get slice from final_video - currently in [T, H, W, C] format, values in [-1, 1]
-            sample_thwc = ctx['final_video'][write_start:write_end]
+            # Get RGB slice from final_video - [T, H, W, 3], values in [-1, 1]
+            # For RGBA, alpha was already written during alpha processing above and is not touched
+            sample_thwc = ctx['final_video'][write_start:write_end, :, :, :3]
             
-            # For RGBA, we only process RGB channels for color correction
-            # Alpha was already written during alpha processing above
-            if ctx.get('is_rgba', False) and sample_thwc.shape[-1] == 4:
-                sample_thwc_rgb = sample_thwc[..., :3]  # [T, H, W, 3]
-                sample = sample_thwc_rgb.permute(0, 3, 1, 2)  # [T, H, W, 3] → [T, 3, H, W]
+            if next_sample is not None:
+                # Slice prefetched during the previous batch
+                sample = wait_for_prefetch(next_sample)
+                next_sample = None
             else:
-                sample = sample_thwc.permute(0, 3, 1, 2)  # [T, H, W, C] → [T, C, H, W]
+                sample = sample_thwc.permute(0, 3, 1, 2)  # [T, H, W, 3] → [T, 3, H, W]
             
-            # Move to VAE device for processing
+            # Start the next slice's host → device copy so it overlaps with this batch's work
+            # (dense for RGB; the strided RGB view of an RGBA output is gathered first by .to())
+            if info_idx + 1 < len(batch_info_list):
+                next_start, next_end = batch_info_list[info_idx + 1][:2]
+                next_sample = prefetch_tensor(ctx['final_video'][next_start:next_end, :, :, :3].permute(0, 3, 1, 2),
+                                              ctx['vae_device'], ctx['compute_dtype'])
+            
+            # Move to VAE device for processing (no-op if already prefetched)
             sample = manage_tensor(
                 tensor=sample,
                 target_device=ctx['vae_device'],
@@ -1248,8 +1391,8 @@ def postprocess_all_batches(
             
             # Reconstruct transformed video on-demand for color correction
             input_video = None
-            if color_correction != "none" and ctx.get('batch_metadata') is not None:
-                if batch_idx < len(ctx['batch_metadata']) and ctx['batch_metadata'][batch_idx] is not None:
+            if color_correction != "none":
+                if batch_idx < len(batches) and batches[batch_idx].metadata is not None:
                     # Reconstruct transformation
                     transformed_video = _reconstruct_and_transform_batch(ctx, batch_idx, debug)
                     input_video = optimized_single_video_rearrange(transformed_video)
@@ -1272,18 +1415,9 @@ def postprocess_all_batches(
                             input_video = input_video[:, :, :true_h, :true_w]
             
             # Apply color correction if enabled (RGB only)
+            # sample holds only RGB here: for RGBA the alpha slot of final_video is never
+            # read back, so there is nothing to split off and re-concatenate afterwards
             if color_correction != "none" and input_video is not None:
-                # Check if RGBA (samples are in T, C, H, W format at this point)
-                has_alpha = ctx.get('is_rgba', False)
-                alpha_channel = None
-                
-                if has_alpha:
-                    # Check actual channel count
-                    if sample.shape[1] == 4:
-                        # Extract and temporarily store alpha for reattachment after color correction
-                        alpha_channel = sample[:, 3:4, :, :]  # (T, 1, H, W)
-                        sample = sample[:, :3, :, :]  # Keep only RGB (T, 3, H, W)
-                
                 # Ensure both tensors are on same device (GPU) for color correction
                 if input_video.device != sample.device:
                     input_video = manage_tensor(
@@ -1320,11 +1454,6 @@ def postprocess_all_batches(
                 
                 # Free the reconstructed transformed video
                 del input_video
-
-                # Recombine with Alpha if it was present in input
-                if has_alpha and alpha_channel is not None:
-                    # Concatenate in channels-first: (T, 3, H, W) + (T, 1, H, W) -> (T, 4, H, W)
-                    sample = torch.cat([sample, alpha_channel], dim=1)
             
             else:
                 debug.log("Color correction disabled (set to none)", category="video", indent_level=1)
@@ -1332,20 +1461,8 @@ def postprocess_all_batches(
             # Convert to final format: [T, C, H, W] → [T, H, W, C]
             sample = optimized_sample_to_image_format(sample)
             
-            # Apply normalization only to RGB channels, preserve Alpha as-is
-            if ctx.get('is_rgba', False) and sample.shape[-1] == 4:
-                # Split RGBA: sample is (T, H, W, C) format after optimized_sample_to_image_format
-                rgb_channels = sample[..., :3]  # (T, H, W, 3)
-                alpha_channel = sample[..., 3:4]  # (T, H, W, 1)
-                
-                # Normalize only RGB from [-1, 1] to [0, 1]
-                rgb_channels.clamp_(-1, 1).mul_(0.5).add_(0.5)
-                
-                # Merge back with unchanged Alpha
-                sample = torch.cat([rgb_channels, alpha_channel], dim=-1)
-            else:
-                # RGB only: apply normalization as usual
-                sample.clamp_(-1, 1).mul_(0.5).add_(0.5)
+            # Normalize RGB from [-1, 1] to [0, 1] (alpha lives only in final_video)
+            sample.clamp_(-1, 1).mul_(0.5).add_(0.5)
             
             # Draw tile boundaries for debugging (if tile info available)
             for phase, attr in [('encode', 'encode_tile_boundaries'), ('decode', 'decode_tile_boundaries')]:
@@ -1354,23 +1471,10 @@ def postprocess_all_batches(
                     sample = _draw_tile_boundaries(sample, debug, tiles, phase)
                     break
             
-            # Move to final_video device and write back in-place
-            sample = manage_tensor(
-                tensor=sample,
-                target_device=ctx['final_video'].device,
-                tensor_name=f"sample_{info_idx+1}_final",
-                dtype=ctx['compute_dtype'],
-                debug=debug,
-                reason="writing processed result to final_video",
-                indent_level=1
-            )
-            
-            # Write back to final_video in-place
-            # For RGBA, write only RGB channels (alpha already written during alpha processing)
-            if ctx.get('is_rgba', False) and ctx['final_video'].shape[-1] == 4:
-                ctx['final_video'][write_start:write_end, :, :, :3] = sample
-            else:
-                ctx['final_video'][write_start:write_end] = sample
+            # Write back to final_video in-place; copy_ moves and casts in one pass
+            # (streamed asynchronously into pinned final_video, which Phase 3 allocates)
+            # Only RGB channels are written (alpha already written during alpha processing)
+            copy_to_host_async(sample_thwc, sample)
             
             # Free sample memory
             del sample, sample_thwc
@@ -1383,6 +1487,9 @@ def postprocess_all_batches(
                 progress_callback(current_postprocessing_step, total_postprocessing_steps,
                                 1, "Phase 4: Post-processing")
 
+        # All batch writes must land before final_video is handed back
+        synchronize_offload_streams()
+        
         # Verify final assembly
         if ctx['final_video'] is not None:
             # Remove prepended frames if any were added at the start
@@ -1435,6 +1542,9 @@ def postprocess_all_batches(
         debug.log(f"Error in Phase 4 (Post-processing): {e}", level="ERROR", category="generation", force=True)
         raise
     finally:
+        # Complete pending asynchronous writes into final_video before leaving the phase
+        synchronize_offload_streams()
+        
         # 1. Clean up decode_batch_info and padding stats
         if 'decode_batch_info' in ctx:
             del ctx['decode_batch_info']
@@ -1454,20 +1564,15 @@ def postprocess_all_batches(
                         transform.__dict__.clear()
             del ctx['video_transform']
         
-        # 3. Clean up storage lists (all_latents, all_alpha_channels, etc.)
-        tensor_storage_keys = ['all_latents', 'all_alpha_channels', 'all_input_rgb']
-        for key in tensor_storage_keys:
-            if key in ctx and ctx[key]:
-                release_tensor_collection(ctx[key])
-                del ctx[key]
+        # 3. Clean up per-batch records (latents, Alpha/RGB stashes, metadata)
+        if 'batches' in ctx:
+            for record in ctx['batches']:
+                record.release()
+            del ctx['batches']
         
         # 4. Clean up non-tensor storage
-        if 'all_ori_lengths' in ctx:
-            del ctx['all_ori_lengths']
         if 'true_target_dims' in ctx:
             del ctx['true_target_dims']
-        if 'batch_metadata' in ctx:
-            del ctx['batch_metadata']
         if 'input_images' in ctx:
             release_tensor_memory(ctx['input_images'])
             del ctx['input_images']
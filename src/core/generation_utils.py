@@ -29,8 +29,9 @@ These utilities support the 4-phase pipeline implemented in generation_phases.py
 
 import os
 import torch
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any, Callable, Union
-from torchvision.transforms import Compose, Lambda, Normalize
+from torchvision.transforms import Compose, Lambda
 
 from .model_configuration import configure_runner
 from .infer import VideoDiffusionInfer
@@ -43,7 +44,6 @@ from ..utils.constants import get_script_directory
 # Get script directory for embeddings
 script_directory = get_script_directory()
 
-
 def prepare_video_transforms(resolution: int, max_resolution: int = 0, debug: Optional['Debug'] = None) -> Compose:
     """
     Prepare optimized video transformation pipeline
@@ -77,9 +77,10 @@ def prepare_video_transforms(resolution: int, max_resolution: int = 0, debug: Op
             downsample_only=False,
             max_resolution=max_resolution,
         ),
-        Lambda(lambda x: torch.clamp(x, 0.0, 1.0)),
-        DivisiblePad((16, 16)),
-        Normalize(0.5, 0.5),
+        # Clamp to [0, 1] and normalize to [-1, 1] in one pass (one allocation, in-place scale)
+        Lambda(lambda x: x.clamp(0.0, 1.0).mul_(2.0).sub_(1.0)),
+        # Pad after normalization with -1.0, which is black (0) in normalized space
+        DivisiblePad((16, 16), value=-1.0),
         Lambda(lambda x: x.permute(1, 0, 2, 3)),  # t c h w -> c t h w (faster than Rearrange)
     ])
 
@@ -318,6 +319,7 @@ def setup_generation_context(
     dit_offload_device: Optional[Union[str, torch.device]] = None,
     vae_offload_device: Optional[Union[str, torch.device]] = None,
     tensor_offload_device: Optional[Union[str, torch.device]] = None,
+    keep_output_on_device: bool = False,
     debug: Optional['Debug'] = None
 ) -> Dict[str, Any]:
     """
@@ -332,6 +334,8 @@ def setup_generation_context(
         dit_offload_device: Device to offload DiT to when not in use (optional)
         vae_offload_device: Device to offload VAE to when not in use (optional)
         tensor_offload_device: Device to offload intermediate tensors to (optional)
+        keep_output_on_device: Allocate the assembled output on the CUDA VAE device when
+                               tensor_offload_device is None (opt-in, highest VRAM usage)
         debug: Debug instance for logging
         
     Returns:
@@ -377,12 +381,12 @@ def setup_generation_context(
         'dit_offload_device': dit_offload_device,
         'vae_offload_device': vae_offload_device,
         'tensor_offload_device': tensor_offload_device,
+        'keep_output_on_device': keep_output_on_device,
         'compute_dtype': COMPUTE_DTYPE,
         'interrupt_fn': interrupt_fn,
         'video_transform': None,
         'text_embeds': None,
-        'all_latents': [],
-        'all_upscaled_latents': [],
+        'batches': [],
         'batch_samples': [],
         'final_video': None,
         'comfyui_available': comfyui_available,
@@ -514,6 +518,19 @@ def prepare_runner(
     return runner, cache_context
 
 
+# Loaded text embeddings keyed by (directory, device, dtype) - reused across runs
+_text_embeddings_cache: Dict[Tuple[str, str, torch.dtype], Dict[str, List[torch.Tensor]]] = {}
+
+
+def _load_embedding(path: str, device: torch.device) -> torch.Tensor:
+    """Load an embedding file straight to device, memory-mapped when the format allows it."""
+    try:
+        return torch.load(path, map_location=device, mmap=True, weights_only=True)
+    except RuntimeError:
+        # Legacy (non-zipfile) serialization cannot be memory-mapped
+        return torch.load(path, map_location=device, weights_only=True)
+
+
 def load_text_embeddings(script_directory: str, device: torch.device, 
                         dtype: torch.dtype, debug: Optional['Debug'] = None) -> Dict[str, List[torch.Tensor]]:
     """
@@ -530,12 +547,20 @@ def load_text_embeddings(script_directory: str, device: torch.device,
         
     Features:
         - Adaptive dtype handling
-        - Device-optimized loading
-        - Memory-efficient embedding preparation
+        - Memory-mapped loading directly to the target device
+        - Cached per (device, dtype) so repeated runs skip disk and transfers
         - Consistent movement logging
     """
-    text_pos_embeds = torch.load(os.path.join(script_directory, 'pos_emb.pt'), weights_only=True)
-    text_neg_embeds = torch.load(os.path.join(script_directory, 'neg_emb.pt'), weights_only=True)
+    cache_key = (script_directory, str(device), dtype)
+    cached = _text_embeddings_cache.get(cache_key)
+    # Reuse only if the cached tensors still own their storage (not released by cleanup)
+    if cached is not None and all(t.numel() > 0 for embeds in cached.values() for t in embeds):
+        if debug:
+            debug.log("Reusing cached text embeddings", category="reuse")
+        return {key: list(embeds) for key, embeds in cached.items()}
+    
+    text_pos_embeds = _load_embedding(os.path.join(script_directory, 'pos_emb.pt'), device)
+    text_neg_embeds = _load_embedding(os.path.join(script_directory, 'neg_emb.pt'), device)
     
     text_pos_embeds = manage_tensor(
         tensor=text_pos_embeds,
@@ -554,7 +579,26 @@ def load_text_embeddings(script_directory: str, device: torch.device,
         reason="DiT inference"
     )
     
-    return {"texts_pos": [text_pos_embeds], "texts_neg": [text_neg_embeds]}
+    embeddings = {"texts_pos": [text_pos_embeds], "texts_neg": [text_neg_embeds]}
+    _text_embeddings_cache[cache_key] = embeddings
+    
+    return {key: list(embeds) for key, embeds in embeddings.items()}
+
+
+@lru_cache(maxsize=128)
+def _batch_params(total_frames: int, batch_size: int, temporal_overlap: int) -> Tuple[int, int, int]:
+    """Memoized (step, temporal_overlap, best_batch) for calculate_optimal_batch_params"""
+    # Calculate step size
+    step = batch_size - temporal_overlap
+    if step <= 0:
+        step = batch_size
+        temporal_overlap = 0
+    
+    # Best batch: largest 4n+1 size ≤ total_frames (maximizes temporal stability)
+    # Closed form avoids building the list of all valid sizes for long videos
+    best_batch = ((total_frames - 1) // 4) * 4 + 1 if total_frames > 0 else 1
+    
+    return step, temporal_overlap, best_batch
 
 
 def calculate_optimal_batch_params(total_frames: int, batch_size: int, 
@@ -575,18 +619,9 @@ def calculate_optimal_batch_params(total_frames: int, batch_size: int,
         }
         
     The 4n+1 constraint (1, 5, 9, 13, 17, 21...) is required by the model.
+    Results are memoized; each call returns a fresh dict.
     """
-    # Calculate step size
-    step = batch_size - temporal_overlap
-    if step <= 0:
-        step = batch_size
-        temporal_overlap = 0
-    
-    # Find all valid 4n+1 batch sizes up to total_frames
-    valid_sizes = [i for i in range(1, total_frames + 1) if i % 4 == 1]
-    
-    # Best batch: largest valid size ≤ total_frames (maximizes temporal stability)
-    best_batch = max(valid_sizes) if valid_sizes else 1
+    step, temporal_overlap, best_batch = _batch_params(total_frames, batch_size, temporal_overlap)
     
     return {
         'step': step,
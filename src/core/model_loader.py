@@ -502,6 +502,7 @@ def materialize_model(runner: VideoDiffusionInfer, model_type: str, device: torc
         return
     param_device = next(model.parameters()).device
     if param_device.type != 'meta':
+        model._materialized = True
         debug.log(f"{model_type_upper} already materialized on {model.device}", category=model_type)
         return
     
@@ -531,6 +532,9 @@ def materialize_model(runner: VideoDiffusionInfer, model_type: str, device: torc
     from .model_configuration import apply_model_specific_config
     model = apply_model_specific_config(model, runner, config, is_dit, debug)
     
+    # Flag checked by the generation phases instead of inspecting parameter devices
+    model._materialized = True
+    
     debug.end_timer(f"{model_type}_materialize", f"{model_type_upper} materialized")
     
     # Clean up checkpoint paths (no longer needed after weights are loaded)
@@ -43,12 +43,14 @@ class DivisibleCrop:
 class DivisiblePad:
     """
     Pad image to make dimensions divisible by a factor.
-    Pads with black (0) to avoid data loss.
+    Pads with black (0) to avoid data loss. Tensor inputs that are already
+    normalized can pass the matching fill value (e.g. -1.0 for [-1, 1] range).
     """
-    def __init__(self, factor):
+    def __init__(self, factor, value: float = 0.0):
         if not isinstance(factor, tuple):
             factor = (factor, factor)
         self.height_factor, self.width_factor = factor[0], factor[1]
+        self.value = value
 
     def __call__(self, image: Union[torch.Tensor, Image.Image]):
         if isinstance(image, torch.Tensor):
@@ -69,7 +71,7 @@ class DivisiblePad:
         if isinstance(image, torch.Tensor):
             # Pad format: (left, right, top, bottom)
             padding = (0, pad_width, 0, pad_height)
-            image = torch.nn.functional.pad(image, padding, mode='constant', value=0.0)
+            image = torch.nn.functional.pad(image, padding, mode='constant', value=self.value)
         elif isinstance(image, Image.Image):
             new_width = width + pad_width
             new_height = height + pad_height
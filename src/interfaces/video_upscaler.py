@@ -26,7 +26,8 @@ from ..core.generation_utils import (
 from ..optimization.memory_manager import (
     cleanup_text_embeddings,
     complete_cleanup,
-    get_device_list
+    get_device_list,
+    to_pageable_tensor
 )
 
 # Import ComfyUI progress reporting
@@ -206,6 +207,16 @@ class SeedVR2VideoUpscaler(io.ComfyNode):
                         "• 'cuda:X': Offload to another GPU (good balance if available, faster than CPU)"
                     )
                 ),
+                io.Boolean.Input("keep_output_on_device",
+                    default=False,
+                    optional=True,
+                    tooltip=(
+                        "Keep the assembled output video on the GPU until the end (default: False).\n"
+                        "Only applies when offload_device is 'none' and the output fits in half the free VRAM.\n"
+                        "Avoids GPU ↔ CPU round-trips during decoding and post-processing,\n"
+                        "but competes with decoding and color correction for VRAM (risk of OOM)."
+                    )
+                ),
                 io.Boolean.Input("enable_debug",
                     default=False,
                     optional=True,
@@ -229,7 +240,7 @@ class SeedVR2VideoUpscaler(io.ComfyNode):
                 uniform_batch_size: bool = False, temporal_overlap: int = 0, prepend_frames: int = 0,
                 color_correction: str = "wavelet", input_noise_scale: float = 0.0,
                 latent_noise_scale: float = 0.0, offload_device: str = "none", 
-                enable_debug: bool = False) -> io.NodeOutput:
+                keep_output_on_device: bool = False, enable_debug: bool = False) -> io.NodeOutput:
         """
         Execute SeedVR2 video upscaling with progress reporting
         
@@ -252,6 +263,7 @@ class SeedVR2VideoUpscaler(io.ComfyNode):
             input_noise_scale: Input noise injection scale [0.0-1.0]
             latent_noise_scale: Latent noise injection scale [0.0-1.0]
             offload_device: Device to offload intermediate tensors
+            keep_output_on_device: Keep the assembled output on the GPU (offload_device 'none' only)
             enable_debug: Enable detailed logging and memory tracking
             
         Returns:
@@ -409,6 +421,7 @@ class SeedVR2VideoUpscaler(io.ComfyNode):
                 dit_offload_device=dit_offload_device,
                 vae_offload_device=vae_offload_device,
                 tensor_offload_device=tensor_offload_device,
+                keep_output_on_device=keep_output_on_device,
                 debug=debug
             )
 
@@ -514,12 +527,14 @@ class SeedVR2VideoUpscaler(io.ComfyNode):
             )
 
             sample = ctx['final_video']
+            # Drop the pipeline's reference so a pinned output buffer is freed before cleanup
+            ctx['final_video'] = None
             debug.log("", category="none", force=True)
 
             # Ensure CPU tensor in float32 for maximum ComfyUI compatibility
             if torch.is_tensor(sample):
-                if sample.is_cuda or sample.is_mps:
-                    sample = sample.cpu()
+                # No-op for CPU tensors; kept blocking since the result is read right away
+                sample = sample.to('cpu')
                 if sample.dtype != torch.float32:
                     src_dtype = sample.dtype
                     try:
@@ -528,6 +543,8 @@ class SeedVR2VideoUpscaler(io.ComfyNode):
                     except Exception as e:
                         debug.log(f"Could not convert to float32: {e}. Output is {src_dtype}, compatibility with other nodes not guaranteed", 
                                   level="WARNING", category="precision", force=True)
+                # The cast above already yields pageable memory; only an uncast pinned output is copied
+                sample = to_pageable_tensor(sample)
 
             debug.log("Upscaling completed successfully!", category="success", force=True)
             debug.end_timer("generation", "Video generation")
@@ -11,6 +11,7 @@ import sys
 import time
 import psutil
 import platform
+from functools import lru_cache
 from typing import Tuple, Dict, Any, Optional, List, Union
 
 
@@ -20,8 +21,9 @@ def _device_str(device: Union[torch.device, str]) -> str:
     return 'MPS' if s.startswith('MPS') else s
 
 
+@lru_cache(maxsize=None)
 def is_mps_available() -> bool:
-    """Check if MPS (Apple Metal) backend is available."""
+    """Check if MPS (Apple Metal) backend is available (cached: fixed for the process lifetime)."""
     return hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
 
 
@@ -129,13 +131,7 @@ def get_basic_vram_info(device: Optional[torch.device] = None) -> Dict[str, Any]
         return {"error": f"Failed to get memory info: {str(e)}"}
 
 
-# Initial VRAM check at module load
-vram_info = get_basic_vram_info(device=None)
-if "error" not in vram_info:
-    backend = "MPS" if is_mps_available() else "CUDA"
-    print(f"📊 Initial {backend} memory: {vram_info['free_gb']:.2f}GB free / {vram_info['total_gb']:.2f}GB total")
-else:
-    print(f"⚠️ Memory check failed: {vram_info['error']} - No available backend!")
+_BYTES_TO_GB = 1.0 / (1024**3)
 
 
 def get_vram_usage(device: Optional[torch.device] = None, debug: Optional['Debug'] = None) -> Tuple[float, float, float, float]:
@@ -157,10 +153,13 @@ def get_vram_usage(device: Optional[torch.device] = None, debug: Optional['Debug
                 device = torch.device("cuda:0")
             elif not isinstance(device, torch.device):
                 device = torch.device(device)
-            allocated = torch.cuda.memory_allocated(device) / (1024**3)
-            reserved = torch.cuda.memory_reserved(device) / (1024**3)
-            peak_allocated = torch.cuda.max_memory_allocated(device) / (1024**3)
-            peak_reserved = torch.cuda.max_memory_reserved(device) / (1024**3)
+            # One allocator snapshot instead of four: memory_allocated() and friends
+            # each rebuild the full memory_stats() dict just to read a single key
+            stats = torch.cuda.memory_stats(device)
+            allocated = stats.get("allocated_bytes.all.current", 0) * _BYTES_TO_GB
+            reserved = stats.get("reserved_bytes.all.current", 0) * _BYTES_TO_GB
+            peak_allocated = stats.get("allocated_bytes.all.peak", 0) * _BYTES_TO_GB
+            peak_reserved = stats.get("reserved_bytes.all.peak", 0) * _BYTES_TO_GB
             return allocated, reserved, peak_allocated, peak_reserved
         elif is_mps_available():
             # MPS doesn't support per-device queries - uses global memory tracking
@@ -213,9 +212,13 @@ def get_ram_usage(debug: Optional['Debug'] = None) -> Tuple[float, float, float,
         return 0.0, 0.0, 0.0, 0.0
     
     
-# Global cache for OS libraries (initialized once)
+# Global cache for OS libraries (initialized once; False once known to be unavailable)
 _os_memory_lib = None
 
+# Optional private torch hooks, resolved once (absent on some PyTorch builds)
+_clear_cublas_workspaces = getattr(torch._C, '_cuda_clearCublasWorkspaces', None)
+_host_empty_cache = getattr(torch._C, '_host_emptyCache', None)
+
 
 def clear_memory(debug: Optional['Debug'] = None, deep: bool = False, force: bool = True, 
                 timer_name: Optional[str] = None) -> None:
@@ -324,8 +327,12 @@ def clear_memory(debug: Optional['Debug'] = None, deep: bool = False, force: boo
                 # Linux: malloc_trim
                 import ctypes  # Import only when needed
                 if _os_memory_lib is None:
-                    _os_memory_lib = ctypes.CDLL("libc.so.6")
-                _os_memory_lib.malloc_trim(0)
+                    try:
+                        _os_memory_lib = ctypes.CDLL("libc.so.6")
+                    except OSError:
+                        _os_memory_lib = False  # e.g. non-glibc systems: don't retry every call
+                if _os_memory_lib:
+                    _os_memory_lib.malloc_trim(0)
                 
             elif sys.platform == 'win32':
                 # Windows: Trim working set
@@ -341,8 +348,7 @@ def clear_memory(debug: Optional['Debug'] = None, deep: bool = False, force: boo
                 import ctypes.util
                 if _os_memory_lib is None:
                     libc_path = ctypes.util.find_library('c')
-                    if libc_path:
-                        _os_memory_lib = ctypes.CDLL(libc_path)
+                    _os_memory_lib = ctypes.CDLL(libc_path) if libc_path else False
                 
                 if _os_memory_lib:
                     _os_memory_lib.sync()
@@ -533,7 +539,7 @@ def cleanup_text_embeddings(ctx: Dict[str, Any], debug: Optional['Debug'] = None
             names.append(key)
     
     if embeddings:
-        release_text_embeddings(embeddings, names, debug)
+        release_text_embeddings(*embeddings, debug=debug)
         
         if debug:
             debug.log(f"Cleaned up text embeddings: {', '.join(names)}", category="cleanup")
@@ -553,19 +559,17 @@ def release_model_memory(model: Optional[torch.nn.Module], debug: Optional['Debu
         return
     
     try:
-        # Clear gradients first
+        # Clear gradients first (sets every param.grad to None)
         model.zero_grad(set_to_none=True)
         
-        # Release GPU memory directly without CPU transfer
+        # Release GPU memory directly without CPU transfer; CPU tensors are skipped
         released_params = 0
         released_buffers = 0
         
         for param in model.parameters():
-            if param.is_cuda or param.is_mps:
-                if param.numel() > 0:
-                    param.data.set_()
-                    released_params += 1
-                param.grad = None
+            if (param.is_cuda or param.is_mps) and param.numel() > 0:
+                param.data.set_()
+                released_params += 1
                 
         for buffer in model.buffers():
             if buffer.is_cuda or buffer.is_mps:
@@ -581,6 +585,304 @@ def release_model_memory(model: Optional[torch.nn.Module], debug: Optional['Debu
             debug.log(f"Failed to release model memory: {e}", level="WARNING", category="memory", force=True)
 
 
+# Dedicated CUDA streams for asynchronous GPU → CPU offloads (one per source device)
+_offload_streams: Dict[torch.device, Any] = {}
+
+
+def _get_offload_stream(device: torch.device) -> 'torch.cuda.Stream':
+    """Get (or lazily create) the offload copy stream for a CUDA device."""
+    stream = _offload_streams.get(device)
+    if stream is None:
+        stream = torch.cuda.Stream(device=device)
+        _offload_streams[device] = stream
+    return stream
+
+
+# Released pinned host buffers, keyed by (shape, dtype), reused by later offloads
+_pinned_pool: Dict[Tuple[torch.Size, torch.dtype], List[torch.Tensor]] = {}
+
+
+def recycle_host_tensor(tensor: Optional[torch.Tensor]) -> None:
+    """
+    Return a pinned CPU tensor to the offload buffer pool, or release it otherwise.
+    
+    The caller must not use the tensor afterwards: a later offload of the same
+    shape and dtype will overwrite it.
+    
+    Args:
+        tensor: Tensor no longer needed by the pipeline
+    """
+    if tensor is not None and torch.is_tensor(tensor) and tensor.device.type == 'cpu' \
+            and tensor.is_pinned() and tensor.is_contiguous():
+        _pinned_pool.setdefault((tensor.shape, tensor.dtype), []).append(tensor)
+    else:
+        release_tensor_memory(tensor)
+
+
+def clear_pinned_pool() -> None:
+    """
+    Drop all pooled pinned host buffers and staging slots so their memory returns to the system.
+    
+    Freed pinned tensors stay page-locked in PyTorch's caching host allocator,
+    so its cache is emptied as well when the build exposes the hook.
+    """
+    _flush_staged_copies()
+    global _next_staging_slot
+    _pinned_pool.clear()
+    _staging_slots[:] = [None, None]
+    _next_staging_slot = 0
+    if _host_empty_cache is not None and is_cuda_available():
+        _host_empty_cache()
+
+
+def _pinned_offload_copy(tensor: torch.Tensor, dtype: torch.dtype) -> torch.Tensor:
+    """
+    Copy a CUDA tensor into pinned CPU memory on the dedicated offload stream.
+
+    The copy overlaps with subsequent work on the compute stream. The returned
+    tensor must not be read on the CPU before synchronize_offload_streams().
+    Destination buffers come from the recycled pool when one of matching shape
+    and dtype is available. New buffers are only pinned within the same RAM
+    budget as allocate_host_tensor(); otherwise, or if pinning fails, the copy
+    falls back to a regular blocking transfer into pageable memory.
+    """
+    if tensor.dtype != dtype:
+        tensor = tensor.to(dtype=dtype)
+
+    pooled = _pinned_pool.get((tensor.shape, dtype))
+    if pooled:
+        pinned = pooled.pop()
+    else:
+        pinned = None
+        if _fits_pinned_budget(tensor.numel() * tensor.element_size()):
+            try:
+                pinned = torch.empty(tensor.shape, dtype=dtype, device='cpu', pin_memory=True)
+            except RuntimeError:
+                pass  # Pinning can fail on constrained hosts - fall back to pageable
+        if pinned is None:
+            return tensor.to('cpu')
+
+    stream = _get_offload_stream(tensor.device)
+    # Wait for the producer kernels, and keep the source alive until the copy completes
+    stream.wait_stream(torch.cuda.current_stream(tensor.device))
+    tensor.record_stream(stream)
+    with torch.cuda.stream(stream):
+        pinned.copy_(tensor, non_blocking=True)
+    return pinned
+
+
+# Two pinned staging slots (ping-pong) for device → host copies into pageable memory,
+# and the staged copies still waiting to be written to their final destination
+_staging_slots: List[Optional[torch.Tensor]] = [None, None]
+_staged_copies: List[Optional[Tuple[Any, torch.Tensor, torch.Tensor]]] = [None, None]
+_next_staging_slot = 0
+
+
+def _flush_staged_copies(slot: Optional[int] = None) -> None:
+    """Complete staged copies (one slot, or all) by writing them to their pageable destination."""
+    for idx in ([slot] if slot is not None else range(len(_staged_copies))):
+        pending = _staged_copies[idx]
+        if pending is not None:
+            event, staged, dst = pending
+            event.synchronize()
+            dst.copy_(staged)
+            _staged_copies[idx] = None
+
+
+def _stage_to_host(dst: torch.Tensor, src: torch.Tensor) -> bool:
+    """
+    Copy a CUDA tensor into contiguous pageable memory through a pinned staging slot.
+    
+    The device → host DMA runs asynchronously on the offload stream; the host-side
+    copy into dst happens when the slot is next reused or at synchronize_offload_streams().
+    
+    Returns:
+        False if no staging slot could be pinned (caller falls back to copy_())
+    """
+    global _next_staging_slot
+    slot = _next_staging_slot
+    # Previous copy through this slot must land before the slot is overwritten
+    _flush_staged_copies(slot)
+    
+    nbytes = dst.numel() * dst.element_size()
+    if _staging_slots[slot] is None or _staging_slots[slot].numel() < nbytes:
+        _staging_slots[slot] = None  # Drop the undersized buffer before pinning a larger one
+        try:
+            _staging_slots[slot] = torch.empty(nbytes, dtype=torch.uint8, device='cpu', pin_memory=True)
+        except RuntimeError:
+            return False  # Pinning can fail on constrained hosts
+    staged = _staging_slots[slot][:nbytes].view(dst.dtype).view(dst.shape)
+    
+    stream = _get_offload_stream(src.device)
+    stream.wait_stream(torch.cuda.current_stream(src.device))
+    src.record_stream(stream)
+    with torch.cuda.stream(stream):
+        staged.copy_(src, non_blocking=True)
+        event = torch.cuda.Event()
+        event.record(stream)
+    
+    _staged_copies[slot] = (event, staged, dst)
+    _next_staging_slot = 1 - slot
+    return True
+
+
+def copy_to_host_async(dst: torch.Tensor, src: torch.Tensor) -> None:
+    """
+    Copy a tensor into a host tensor, asynchronously when possible.
+    
+    When src is on CUDA and dst is a contiguous view of pinned CPU memory, the copy
+    runs on the dedicated offload stream. Contiguous pageable destinations go through
+    a small pinned staging slot instead, so very large outputs never need to be pinned.
+    Either way, dst must not be read on the CPU before synchronize_offload_streams().
+    Otherwise falls back to a regular copy_().
+    
+    Args:
+        dst: Destination CPU tensor (or slice of one)
+        src: Source tensor, broadcastable to dst
+    """
+    if not (src.is_cuda and dst.device.type == 'cpu' and dst.is_contiguous()):
+        dst.copy_(src)
+        return
+    
+    if not dst.is_pinned():
+        if not _stage_to_host(dst, src):
+            dst.copy_(src)
+        return
+    
+    stream = _get_offload_stream(src.device)
+    # Wait for the producer kernels, and keep the source alive until the copy completes
+    stream.wait_stream(torch.cuda.current_stream(src.device))
+    src.record_stream(stream)
+    with torch.cuda.stream(stream):
+        dst.copy_(src, non_blocking=True)
+
+
+def _fits_pinned_budget(nbytes: int, max_pinned_fraction: float = 0.25) -> bool:
+    """Check a pinned allocation, rounded up to a power of two as the caching host allocator does, against available RAM."""
+    pinned_nbytes = 1 << max(nbytes - 1, 0).bit_length()
+    return pinned_nbytes <= psutil.virtual_memory().available * max_pinned_fraction
+
+
+def allocate_host_tensor(shape: Tuple[int, ...], dtype: torch.dtype,
+                         max_pinned_fraction: float = 0.25) -> torch.Tensor:
+    """
+    Allocate a CPU tensor, pinned when CUDA is available and it fits comfortably in RAM.
+    
+    Pinned host memory enables asynchronous device → host copies, but it cannot
+    be swapped, so large allocations stay pageable. The caching host allocator
+    rounds pinned blocks up to a power of two, so the budget is checked against
+    the rounded size. Hand the result to callers outside the pipeline through
+    to_pageable_tensor().
+    
+    Args:
+        shape: Tensor shape
+        dtype: Tensor dtype
+        max_pinned_fraction: Largest share of available system RAM to pin
+        
+    Returns:
+        Uninitialized CPU tensor (pinned or pageable)
+    """
+    if is_cuda_available():
+        numel = 1
+        for dim in shape:
+            numel *= dim
+        nbytes = numel * torch.empty((), dtype=dtype).element_size()
+        if _fits_pinned_budget(nbytes, max_pinned_fraction):
+            try:
+                return torch.empty(shape, dtype=dtype, device='cpu', pin_memory=True)
+            except RuntimeError:
+                pass  # Pinning can fail on constrained hosts - fall back to pageable
+    return torch.empty(shape, dtype=dtype, device='cpu')
+
+
+def to_pageable_tensor(tensor: torch.Tensor) -> torch.Tensor:
+    """
+    Return a pageable copy of a pinned CPU tensor (other tensors are returned as-is).
+    
+    Used by the interfaces on the final output when no dtype conversion already
+    produced a pageable copy, so callers that cache it (e.g. ComfyUI node outputs)
+    never hold page-locked memory. Once the pinned original is dropped, its block
+    returns to the host allocator cache, which complete_cleanup() empties.
+    
+    Args:
+        tensor: Tensor to hand out
+        
+    Returns:
+        Tensor backed by pageable memory
+    """
+    if tensor.device.type != 'cpu' or not tensor.is_pinned():
+        return tensor
+    pageable = torch.empty(tensor.shape, dtype=tensor.dtype, device='cpu')
+    pageable.copy_(tensor)
+    return pageable
+
+
+def synchronize_offload_streams() -> None:
+    """Wait for all pending asynchronous offloads (manage_tensor(non_blocking=True), copy_to_host_async)."""
+    for stream in _offload_streams.values():
+        stream.synchronize()
+    _flush_staged_copies()
+
+
+# Dedicated CUDA streams for asynchronous CPU → GPU prefetches (one per target device)
+_prefetch_streams: Dict[torch.device, Any] = {}
+
+
+def prefetch_tensor(tensor: Optional[torch.Tensor], target_device: torch.device,
+                    dtype: Optional[torch.dtype] = None) -> Optional[torch.Tensor]:
+    """
+    Start copying a CPU tensor to a CUDA device on a side stream.
+    
+    The copy overlaps with work already queued on the compute stream. The result
+    must go through wait_for_prefetch() before it is used on the compute stream.
+    
+    Args:
+        tensor: Tensor to prefetch (ideally in pinned memory for a true async DMA)
+        target_device: Destination device
+        dtype: Optional target dtype
+        
+    Returns:
+        Destination tensor, or the input unchanged when no prefetch applies
+        (non-CUDA target or tensor not on CPU)
+    """
+    if tensor is None or target_device.type != 'cuda' or tensor.device.type != 'cpu':
+        return tensor
+    
+    # Key streams by indexed device so wait_for_prefetch() finds them via tensor.device
+    if target_device.index is None:
+        target_device = torch.device('cuda', torch.cuda.current_device())
+    
+    stream = _prefetch_streams.get(target_device)
+    if stream is None:
+        stream = torch.cuda.Stream(device=target_device)
+        _prefetch_streams[target_device] = stream
+    
+    with torch.cuda.stream(stream):
+        return tensor.to(target_device, dtype=dtype or tensor.dtype, non_blocking=True)
+
+
+def wait_for_prefetch(tensor: Optional[torch.Tensor]) -> Optional[torch.Tensor]:
+    """
+    Make the current stream wait for prefetches issued so far to the tensor's device.
+    
+    Args:
+        tensor: Tensor returned by prefetch_tensor()
+        
+    Returns:
+        The same tensor, safe to use on the current stream
+    """
+    if tensor is None or not tensor.is_cuda:
+        return tensor
+    
+    stream = _prefetch_streams.get(tensor.device)
+    if stream is not None:
+        current = torch.cuda.current_stream(tensor.device)
+        current.wait_stream(stream)
+        # Memory was allocated on the prefetch stream; tie its lifetime to the consumer
+        tensor.record_stream(current)
+    return tensor
+
+
 def manage_tensor(
     tensor: torch.Tensor,
     target_device: torch.device,
@@ -602,7 +904,9 @@ def manage_tensor(
         target_device: Target device (torch.device object)
         tensor_name: Descriptive name for logging (e.g., "latent", "sample", "alpha_channel")
         dtype: Optional target dtype to cast to (if None, keeps original dtype)
-        non_blocking: Whether to use non-blocking transfer
+        non_blocking: Whether to use non-blocking transfer. CUDA → CPU offloads are
+                      copied into pinned memory on a dedicated stream; call
+                      synchronize_offload_streams() before reading them on the CPU
         debug: Debug instance for logging
         reason: Optional reason for the operation (e.g., "inference", "offload", "dtype alignment")
         indent_level: Indentation level for debug logging (0=no indent, 1=2 spaces, etc.)
@@ -656,7 +960,10 @@ def manage_tensor(
         )
     
     # Perform the operation based on what needs to change
-    if needs_device_move and needs_dtype_change:
+    if non_blocking and needs_device_move and current_device.type == 'cuda' and str(target_device) == 'cpu':
+        # Asynchronous offload through pinned memory (overlaps with compute)
+        return _pinned_offload_copy(tensor, target_dtype)
+    elif needs_device_move and needs_dtype_change:
         # Both device and dtype need to change
         return tensor.to(target_device, dtype=target_dtype, non_blocking=non_blocking)
     elif needs_device_move:
@@ -948,19 +1255,8 @@ def clear_runtime_caches(runner: Any, debug: Optional['Debug'] = None) -> int:
 
         cache_entries = len(runner.cache.cache)
         
-        # Properly release tensor memory and delete as we go
-        for key in list(runner.cache.cache.keys()):
-            value = runner.cache.cache[key]
-            if torch.is_tensor(value):
-                release_tensor_memory(value)
-            elif isinstance(value, (list, tuple)):
-                for item in value:
-                    if torch.is_tensor(item):
-                        release_tensor_memory(item)
-            # Delete immediately to release reference
-            del runner.cache.cache[key]
-
-        # Final clear for safety
+        # Release tensor storage in one pass over the values, then drop all references at once
+        release_tensor_collection(list(runner.cache.cache.values()))
         runner.cache.cache.clear()
         cleaned_items += cache_entries
 
@@ -1199,8 +1495,9 @@ def complete_cleanup(runner: Any, debug: Optional['Debug'] = None, dit_cache: bo
     if hasattr(runner, 'vae') and runner.vae is not None:
         cleanup_vae(runner=runner, debug=debug, cache_model=vae_cache)
     
-    # 2. Clear remaining runtime caches
+    # 2. Clear remaining runtime caches and pooled pinned host buffers
     clear_runtime_caches(runner=runner, debug=debug)
+    clear_pinned_pool()
     
     # 3. Clear config and other non-model components when fully releasing runner
     if not (dit_cache or vae_cache):
@@ -1213,7 +1510,8 @@ def complete_cleanup(runner: Any, debug: Optional['Debug'] = None, dit_cache: bo
     clear_memory(debug=debug, deep=True, force=True, timer_name="complete_cleanup")
     
     # 5. Clear cuBLAS workspaces
-    torch._C._cuda_clearCublasWorkspaces() if hasattr(torch._C, '_cuda_clearCublasWorkspaces') else None
+    if _clear_cublas_workspaces is not None:
+        _clear_cublas_workspaces()
     
     # Log what models are cached for next run
     if dit_cache or vae_cache:
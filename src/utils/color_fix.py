@@ -13,7 +13,9 @@ Available Methods:
 - adain: Adaptive instance normalization style transfer
 """
 
+import math
 import torch
+from functools import lru_cache
 from PIL import Image
 from torch import Tensor
 from torch.nn import functional as F
@@ -22,6 +24,7 @@ from torchvision.transforms import ToTensor, ToPILImage
 from ..common.half_precision_fixes import safe_pad_operation, safe_interpolate_operation, ensure_float32_precision
 
 
+@torch.no_grad()
 def adain_color_fix(target: Image.Image, source: Image.Image) -> Image.Image:
     """
     Apply AdaIN color correction to PIL images.
@@ -45,6 +48,7 @@ def adain_color_fix(target: Image.Image, source: Image.Image) -> Image.Image:
     return result_image
 
 
+@torch.no_grad()
 def wavelet_color_fix(target: Image.Image, source: Image.Image, debug: Optional['Debug'] = None) -> Image.Image:
     """
     Apply wavelet-based color correction to PIL images.
@@ -91,6 +95,7 @@ def calc_mean_std(feat: Tensor, eps: float = 1e-5) -> tuple[Tensor, Tensor]:
     return feat_mean, feat_std
 
 
+@torch.no_grad()
 def adaptive_instance_normalization(content_feat: Tensor, style_feat: Tensor) -> Tensor:
     """
     Adaptive Instance Normalization (AdaIN) for style transfer.
@@ -119,6 +124,26 @@ def adaptive_instance_normalization(content_feat: Tensor, style_feat: Tensor) ->
     return result
 
 
+# 1D taps of the 3x3 Gaussian-approximation kernel used by wavelet_blur: their outer
+# product is [[0.0625, 0.125, 0.0625], [0.125, 0.25, 0.125], [0.0625, 0.125, 0.0625]]
+_BLUR_TAPS = (0.25, 0.5, 0.25)
+
+
+@lru_cache(maxsize=8)
+def _blur_kernel(dtype: torch.dtype, device: torch.device, num_channels: int) -> tuple[Tensor, Tensor]:
+    """
+    Build the separable depthwise blur kernels once per (dtype, device, channels).
+    
+    Returns:
+        Tuple of horizontal [C, 1, 1, 3] and vertical [C, 1, 3, 1] kernels
+        (treat as read-only: they are shared across calls)
+    """
+    taps = torch.tensor(_BLUR_TAPS, dtype=dtype, device=device)
+    horizontal = taps.view(1, 1, 1, 3).repeat(num_channels, 1, 1, 1)
+    vertical = taps.view(1, 1, 3, 1).repeat(num_channels, 1, 1, 1)
+    return horizontal, vertical
+
+
 def wavelet_blur(image: Tensor, radius: int) -> Tensor:
     """
     Apply Gaussian-like blur using dilated convolution for wavelet decomposition.
@@ -141,18 +166,16 @@ def wavelet_blur(image: Tensor, radius: int) -> Tensor:
     
     num_channels = image.shape[1]
     
-    # 3x3 Gaussian-approximation kernel
-    kernel_vals = [
-        [0.0625, 0.125, 0.0625],
-        [0.125,  0.25,  0.125],
-        [0.0625, 0.125, 0.0625],
-    ]
-    kernel = torch.tensor(kernel_vals, dtype=image.dtype, device=image.device)
-    kernel = kernel[None, None].repeat(num_channels, 1, 1, 1)
+    # 3x3 Gaussian-approximation kernel, applied as two separable 3-tap passes
+    # (cached per dtype/device/channels)
+    horizontal, vertical = _blur_kernel(image.dtype, image.device, num_channels)
     
-    # Apply padding and grouped convolution
-    image = safe_pad_operation(image, (radius, radius, radius, radius), mode='replicate')
-    output = F.conv2d(image, kernel, groups=num_channels, dilation=radius)
+    # Replicate padding commutes with the per-axis blur, so padding each axis right
+    # before its pass matches padding both axes up front for a 3x3 convolution
+    image = safe_pad_operation(image, (radius, radius, 0, 0), mode='replicate')
+    image = F.conv2d(image, horizontal, groups=num_channels, dilation=(1, radius))
+    image = safe_pad_operation(image, (0, 0, radius, radius), mode='replicate')
+    output = F.conv2d(image, vertical, groups=num_channels, dilation=(radius, 1))
     
     return output
 
@@ -173,17 +196,19 @@ def wavelet_decomposition(image: Tensor, levels: int = 5) -> tuple[Tensor, Tenso
         - high_freq: Detail information [B, C, H, W]
         - low_freq: Color/illumination information [B, C, H, W]
     """
-    high_freq = torch.zeros_like(image)
-    
+    # The per-level details (image_i - low_i) telescope: their sum is simply
+    # image_0 - low_last, so only the blur chain is needed inside the loop
+    low_freq = image
     for i in range(levels):
         radius = 2 ** i
-        low_freq = wavelet_blur(image, radius)
-        high_freq.add_(image).sub_(low_freq)
-        image = low_freq
+        low_freq = wavelet_blur(low_freq, radius)
+    
+    high_freq = image - low_freq
     
     return high_freq, low_freq
 
 
+@torch.no_grad()
 def wavelet_reconstruction(content_feat: Tensor, style_feat: Tensor, debug: Optional['Debug'] = None) -> Tensor:
     """
     Apply wavelet-based color transfer from style to content.
@@ -246,6 +271,7 @@ def wavelet_reconstruction(content_feat: Tensor, style_feat: Tensor, debug: Opti
     return content_high_freq.clamp_(-1.0, 1.0)
 
 
+@torch.no_grad()
 def lab_color_transfer(
     content_feat: Tensor,
     style_feat: Tensor,
@@ -279,6 +305,11 @@ def lab_color_transfer(
     # Step 1: Apply wavelet to get artifact-free base with correct spatial structure
     content_feat = wavelet_reconstruction(content_feat, style_feat, debug=None)
     
+    # Convert to float32 before any resize: the style input is the low-resolution
+    # source, so promoting it first avoids a full-size reduced-precision intermediate
+    content_feat, original_dtype = ensure_float32_precision(content_feat)
+    style_feat, _ = ensure_float32_precision(style_feat)
+    
     # Handle spatial dimension mismatch (should already match after wavelet)
     if content_feat.shape != style_feat.shape:
         debug.log(
@@ -292,39 +323,20 @@ def lab_color_transfer(
             align_corners=False
         )
     
-    # Store device and convert to float32
     device = content_feat.device
     
-    # Convert to float32 for accurate color space conversion
-    content_feat, original_dtype = ensure_float32_precision(content_feat)
-    style_feat, _ = ensure_float32_precision(style_feat)
-    
-    # Precompute color space conversion matrices
-    rgb_to_xyz_matrix = torch.tensor([
-        [0.4124564, 0.3575761, 0.1804375],
-        [0.2126729, 0.7151522, 0.0721750],
-        [0.0193339, 0.1191920, 0.9503041]
-    ], dtype=torch.float32, device=device)
-    
-    xyz_to_rgb_matrix = torch.tensor([
-        [ 3.2404542, -1.5371385, -0.4985314],
-        [-0.9692660,  1.8760108,  0.0415560],
-        [ 0.0556434, -0.2040259,  1.0572252]
-    ], dtype=torch.float32, device=device)
-    
-    # LAB conversion constants
-    epsilon = 6.0 / 29.0
-    kappa = (29.0 / 3.0) ** 3
+    # Color space conversion matrices (built once per device)
+    rgb_to_xyz_matrix, xyz_to_rgb_matrix = _lab_matrices(device)
     
     # Convert from [-1, 1] to [0, 1] range (in-place)
     content_feat.add_(1.0).mul_(0.5).clamp_(0.0, 1.0)
     style_feat.add_(1.0).mul_(0.5).clamp_(0.0, 1.0)
     
     # Convert to LAB color space
-    content_lab = _rgb_to_lab_batch(content_feat, device, rgb_to_xyz_matrix, epsilon, kappa)
+    content_lab = _rgb_to_lab_batch(content_feat, device, rgb_to_xyz_matrix)
     del content_feat
     
-    style_lab = _rgb_to_lab_batch(style_feat, device, rgb_to_xyz_matrix, epsilon, kappa)
+    style_lab = _rgb_to_lab_batch(style_feat, device, rgb_to_xyz_matrix)
     del style_feat, rgb_to_xyz_matrix
     
     # Match chrominance channels (a*, b*) for accurate color transfer
@@ -336,20 +348,20 @@ def lab_color_transfer(
         # Partially match luminance for better overall color accuracy
         matched_L = _histogram_matching_channel(content_lab[:, 0], style_lab[:, 0], device)
         # Blend: preserve some content L* for detail, adopt some style L* for color
-        result_L = content_lab[:, 0].mul(luminance_weight).add_(matched_L.mul(1.0 - luminance_weight))
+        content_lab[:, 0].mul_(luminance_weight).add_(matched_L.mul_(1.0 - luminance_weight))
         del matched_L
-    else:
-        # Fully preserve content luminance
-        result_L = content_lab[:, 0]
+    # else: fully preserve content luminance (channel 0 left untouched)
     
-    del content_lab, style_lab
+    del style_lab
     
-    # Reconstruct LAB with corrected channels
-    result_lab = torch.stack([result_L, matched_a, matched_b], dim=1)
-    del result_L, matched_a, matched_b
+    # Reconstruct LAB with corrected channels, reusing the content LAB buffer
+    content_lab[:, 1].copy_(matched_a)
+    content_lab[:, 2].copy_(matched_b)
+    result_lab = content_lab
+    del content_lab, matched_a, matched_b
     
     # Convert back to RGB
-    result_rgb = _lab_to_rgb_batch(result_lab, device, xyz_to_rgb_matrix, epsilon, kappa)
+    result_rgb = _lab_to_rgb_batch(result_lab, device, xyz_to_rgb_matrix)
     del result_lab, xyz_to_rgb_matrix
     
     # Convert back to [-1, 1] range (in-place)
@@ -365,113 +377,102 @@ def lab_color_transfer(
     return result
 
 
-def _rgb_to_lab_batch(rgb: Tensor, device: torch.device, matrix: Tensor, epsilon: float, kappa: float) -> Tensor:
+# sRGB (D65) <-> CIE XYZ conversion matrices
+_RGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+_XYZ_TO_RGB = (
+    ( 3.2404542, -1.5371385, -0.4985314),
+    (-0.9692660,  1.8760108,  0.0415560),
+    ( 0.0556434, -0.2040259,  1.0572252),
+)
+# D65 reference white (X, Y, Z)
+_D65_WHITE = (0.95047, 1.0, 1.08883)
+# CIELAB piecewise-function constants
+_LAB_EPSILON = 6.0 / 29.0
+_LAB_EPSILON_CUBED = _LAB_EPSILON ** 3
+_LAB_KAPPA = (29.0 / 3.0) ** 3
+
+
+@lru_cache(maxsize=8)
+def _lab_matrices(device: torch.device) -> tuple[Tensor, Tensor]:
+    """
+    Build the float32 RGB->XYZ and XYZ->RGB matrices once per device.
+    
+    The D65 white-point normalization is folded into the matrices: rows of the
+    forward matrix are divided by the white point, columns of the inverse are
+    multiplied by it, so XYZ values come out (and go in) already normalized.
+    
+    Returns:
+        Tuple of (rgb_to_xyz, xyz_to_rgb) [3, 3] tensors (read-only, shared across calls)
+    """
+    white = torch.tensor(_D65_WHITE, dtype=torch.float32, device=device)
+    rgb_to_xyz = torch.tensor(_RGB_TO_XYZ, dtype=torch.float32, device=device) / white[:, None]
+    xyz_to_rgb = torch.tensor(_XYZ_TO_RGB, dtype=torch.float32, device=device) * white[None, :]
+    return rgb_to_xyz, xyz_to_rgb
+
+
+def _rgb_to_lab_batch(rgb: Tensor, device: torch.device, matrix: Tensor) -> Tensor:
     """Convert batch of RGB images to CIELAB color space using D65 illuminant."""
-    # Apply sRGB gamma correction (linearize)
+    # Apply sRGB gamma correction (linearize); the power branch is built in
+    # place and the select writes back into it
     mask = rgb > 0.04045
-    rgb_linear = torch.where(
-        mask,
-        torch.pow((rgb + 0.055) / 1.055, 2.4),
-        rgb / 12.92
-    )
+    rgb_linear = rgb.add(0.055).div_(1.055).pow_(2.4)
+    torch.where(mask, rgb_linear, rgb.div(12.92), out=rgb_linear)
     del mask
     
-    # Matrix multiplication: RGB -> XYZ
-    B, C, H, W = rgb_linear.shape
-    rgb_flat = rgb_linear.permute(0, 2, 3, 1).reshape(-1, 3)
-    del rgb_linear
-    
+    # Matrix multiplication: RGB -> XYZ, directly on the channel dim (stays NCHW)
+    # D65 white-point normalization is folded into the matrix (see _lab_matrices)
     # Ensure dtype consistency for matrix multiplication
-    rgb_flat = rgb_flat.to(dtype=matrix.dtype)
-    xyz_flat = torch.matmul(rgb_flat, matrix.T)
-    del rgb_flat
-    
-    xyz = xyz_flat.reshape(B, H, W, 3).permute(0, 3, 1, 2)
-    del xyz_flat
-    
-    # Normalize by D65 white point (in-place)
-    xyz[:, 0].div_(0.95047)  # X
-    # xyz[:, 1] /= 1.00000  # Y (no-op, skip)
-    xyz[:, 2].div_(1.08883)  # Z
+    xyz = torch.einsum('ij,bjhw->bihw', matrix, rgb_linear.to(dtype=matrix.dtype))
+    del rgb_linear
     
     # XYZ to LAB transformation
-    epsilon_cubed = epsilon ** 3
-    mask = xyz > epsilon_cubed
-    f_xyz = torch.where(
-        mask,
-        torch.pow(xyz, 1.0 / 3.0),
-        xyz.mul(kappa).add_(16.0).div_(116.0)
-    )
+    mask = xyz > _LAB_EPSILON_CUBED
+    f_xyz = torch.pow(xyz, 1.0 / 3.0)
+    torch.where(mask, f_xyz, xyz.mul_(_LAB_KAPPA).add_(16.0).div_(116.0), out=f_xyz)
     del xyz, mask
     
-    # Extract channels and compute LAB
-    L = f_xyz[:, 1].mul(116.0).sub_(16.0)  # Lightness [0, 100]
-    a = (f_xyz[:, 0] - f_xyz[:, 1]).mul_(500.0)  # Green-Red [-128, 127]
-    b = (f_xyz[:, 1] - f_xyz[:, 2]).mul_(200.0)  # Blue-Yellow [-128, 127]
+    # Compute LAB channels directly into a single NCHW output (no per-channel temporaries)
+    lab = torch.empty_like(f_xyz)
+    torch.mul(f_xyz[:, 1], 116.0, out=lab[:, 0]).sub_(16.0)  # Lightness [0, 100]
+    torch.sub(f_xyz[:, 0], f_xyz[:, 1], out=lab[:, 1]).mul_(500.0)  # Green-Red [-128, 127]
+    torch.sub(f_xyz[:, 1], f_xyz[:, 2], out=lab[:, 2]).mul_(200.0)  # Blue-Yellow [-128, 127]
     del f_xyz
     
-    return torch.stack([L, a, b], dim=1)
+    return lab
 
 
-def _lab_to_rgb_batch(lab: Tensor, device: torch.device, matrix_inv: Tensor, epsilon: float, kappa: float) -> Tensor:
+def _lab_to_rgb_batch(lab: Tensor, device: torch.device, matrix_inv: Tensor) -> Tensor:
     """Convert batch of CIELAB images to RGB color space."""
-    L, a, b = lab[:, 0], lab[:, 1], lab[:, 2]
-    
-    # LAB to XYZ
-    fy = (L + 16.0) / 116.0
-    fx = a.div(500.0).add_(fy)
-    fz = fy - b / 200.0
-    del L, a, b
-    
-    # XYZ transformation
-    x = torch.where(
-        fx > epsilon,
-        torch.pow(fx, 3.0),
-        fx.mul(116.0).sub_(16.0).div_(kappa)
-    )
-    y = torch.where(
-        fy > epsilon,
-        torch.pow(fy, 3.0),
-        fy.mul(116.0).sub_(16.0).div_(kappa)
-    )
-    z = torch.where(
-        fz > epsilon,
-        torch.pow(fz, 3.0),
-        fz.mul(116.0).sub_(16.0).div_(kappa)
-    )
-    del fx, fy, fz
-    
-    # Apply D65 white point (in-place)
-    x.mul_(0.95047)
-    # y *= 1.00000  # (no-op, skip)
-    z.mul_(1.08883)
-    
-    xyz = torch.stack([x, y, z], dim=1)
-    del x, y, z
-    
-    # Matrix multiplication: XYZ -> RGB
-    B, C, H, W = xyz.shape
-    xyz_flat = xyz.permute(0, 2, 3, 1).reshape(-1, 3)
-    del xyz
-    
+    # LAB to f(XYZ), written directly into a single NCHW buffer
+    f_xyz = torch.empty_like(lab)
+    fy = torch.add(lab[:, 0], 16.0, out=f_xyz[:, 1]).div_(116.0)
+    torch.div(lab[:, 1], 500.0, out=f_xyz[:, 0]).add_(fy)
+    torch.div(lab[:, 2], -200.0, out=f_xyz[:, 2]).add_(fy)
+    del fy
+    
+    # XYZ transformation (all three channels at once); cube by multiplication
+    mask = f_xyz > _LAB_EPSILON
+    xyz = torch.mul(f_xyz, f_xyz).mul_(f_xyz)
+    torch.where(mask, xyz, f_xyz.mul_(116.0).sub_(16.0).div_(_LAB_KAPPA), out=xyz)
+    del f_xyz, mask
+    
+    # Matrix multiplication: XYZ -> RGB, directly on the channel dim (stays NCHW)
+    # D65 white point is folded into the inverse matrix (see _lab_matrices)
     # Ensure dtype consistency for matrix multiplication
-    xyz_flat = xyz_flat.to(dtype=matrix_inv.dtype)
-    rgb_linear_flat = torch.matmul(xyz_flat, matrix_inv.T)
-    del xyz_flat
-    
-    rgb_linear = rgb_linear_flat.reshape(B, H, W, 3).permute(0, 3, 1, 2)
-    del rgb_linear_flat
+    rgb_linear = torch.einsum('ij,bjhw->bihw', matrix_inv, xyz.to(dtype=matrix_inv.dtype))
+    del xyz
     
     # Apply inverse gamma correction (delinearize)
     mask = rgb_linear > 0.0031308
-    rgb = torch.where(
-        mask,
-        torch.pow(torch.clamp(rgb_linear, min=0.0), 1.0 / 2.4).mul_(1.055).sub_(0.055),
-        rgb_linear * 12.92
-    )
+    rgb = rgb_linear.clamp(min=0.0).pow_(1.0 / 2.4).mul_(1.055).sub_(0.055)
+    torch.where(mask, rgb, rgb_linear.mul_(12.92), out=rgb)
     del mask, rgb_linear
     
-    return torch.clamp(rgb, 0.0, 1.0)
+    return rgb.clamp_(0.0, 1.0)
 
 
 def _histogram_matching_channel(source: Tensor, reference: Tensor, device: torch.device) -> Tensor:
@@ -485,43 +486,17 @@ def _histogram_matching_channel(source: Tensor, reference: Tensor, device: torch
     Returns:
         Matched channel tensor [B, H, W]
     """
-    original_shape = source.shape
-    
-    # Flatten
-    source_flat = source.flatten()
-    reference_flat = reference.flatten()
-    
-    # Sort both arrays
-    source_sorted, source_indices = torch.sort(source_flat)
-    reference_sorted, _ = torch.sort(reference_flat)
-    del reference_flat
-    
-    # Quantile mapping
-    n_source = len(source_sorted)
-    n_reference = len(reference_sorted)
-    
-    if n_source == n_reference:
-        matched_sorted = reference_sorted
-    else:
-        # Interpolate reference to match source quantiles
-        source_quantiles = torch.linspace(0, 1, n_source, device=device)
-        ref_indices = (source_quantiles * (n_reference - 1)).long()
-        ref_indices.clamp_(0, n_reference - 1)
-        matched_sorted = reference_sorted[ref_indices]
-        del source_quantiles, ref_indices, reference_sorted
+    # Large channels are mapped in their own layout, with no flatten/reshape copy
+    if source.numel() > _HIST_MATCH_MAX_SAMPLES:
+        return _histogram_match_sampled(source, reference)
     
-    del source_sorted, source_flat
-    
-    # Reconstruct using argsort (portable across CUDA/ROCm/MPS)
-    inverse_indices = torch.argsort(source_indices)
-    del source_indices
-    matched_flat = matched_sorted[inverse_indices]
-    del matched_sorted, inverse_indices
-    
-    return matched_flat.reshape(original_shape)
+    matched_flat = _histogram_match_1d(source.flatten(), reference.flatten(), device)
+    return matched_flat.reshape(source.shape)
 
 
-def hsv_saturation_histogram_match(content_feat: Tensor, style_feat: Tensor, debug: Optional['Debug'] = None) -> Tensor:
+@torch.no_grad()
+def hsv_saturation_histogram_match(content_feat: Tensor, style_feat: Tensor, debug: Optional['Debug'] = None,
+                                   return_saturation: bool = False):
     """
     Hue-conditional saturation histogram matching in HSV color space.
     
@@ -542,10 +517,17 @@ def hsv_saturation_histogram_match(content_feat: Tensor, style_feat: Tensor, deb
         content_feat: Target tensor [B, C, H, W] in [-1, 1] with upscaled details
         style_feat: Source tensor [B, C, H, W] in [-1, 1] with original saturation
         debug: Debug instance for logging
+        return_saturation: If True, also return the content and style saturation maps
+                           [B, 1, H, W] computed along the way
         
     Returns:
-        Saturation-corrected tensor [B, C, H, W] in [-1, 1]
+        Saturation-corrected tensor [B, C, H, W] in [-1, 1], or a tuple
+        (result, content_saturation, style_saturation) if return_saturation is True
     """
+    # Convert to float32 for processing (before resizing the low-resolution style)
+    content_feat, original_dtype = ensure_float32_precision(content_feat)
+    style_feat, _ = ensure_float32_precision(style_feat)
+    
     # Handle spatial dimension mismatch
     if content_feat.shape != style_feat.shape:
         debug.log(
@@ -559,10 +541,6 @@ def hsv_saturation_histogram_match(content_feat: Tensor, style_feat: Tensor, deb
             align_corners=False
         )
     
-    # Convert to float32 for processing
-    content_feat, original_dtype = ensure_float32_precision(content_feat)
-    style_feat, _ = ensure_float32_precision(style_feat)
-    
     # Convert from [-1, 1] to [0, 1] range (in-place)
     content_rgb = content_feat.add(1.0).mul_(0.5).clamp_(0.0, 1.0)
     style_rgb = style_feat.add(1.0).mul_(0.5).clamp_(0.0, 1.0)
@@ -578,8 +556,6 @@ def hsv_saturation_histogram_match(content_feat: Tensor, style_feat: Tensor, deb
     # Extract channels
     content_h = content_hsv[:, 0]
     content_s = content_hsv[:, 1]
-    content_v = content_hsv[:, 2]
-    del content_hsv
     
     style_h = style_hsv[:, 0]
     style_s = style_hsv[:, 1]
@@ -587,11 +563,14 @@ def hsv_saturation_histogram_match(content_feat: Tensor, style_feat: Tensor, deb
     
     # Match saturation per hue bin
     matched_s = _hue_conditional_saturation_match(content_h, content_s, style_h, style_s)
-    del style_h, style_s
+    # Content S is overwritten below, so the returned map must be a copy
+    saturation_maps = (content_s.unsqueeze(1).clone(), style_s.unsqueeze(1)) if return_saturation else None
+    del content_h, style_h, style_s
     
-    # Reconstruct HSV: preserve H and V from content, use matched S
-    result_hsv = torch.stack([content_h, matched_s, content_v], dim=1)
-    del content_h, matched_s, content_v
+    # Reconstruct HSV in place: preserve H and V from content, use matched S
+    content_s.copy_(matched_s)
+    result_hsv = content_hsv
+    del content_hsv, content_s, matched_s
     
     # Convert back to RGB
     result_rgb = _hsv_to_rgb_batch(result_hsv)
@@ -608,6 +587,8 @@ def hsv_saturation_histogram_match(content_feat: Tensor, style_feat: Tensor, deb
     
     debug.log("HSV hue-conditional saturation matching completed", category="video", indent_level=1)
     
+    if return_saturation:
+        return (result,) + saturation_maps
     return result
 
 
@@ -615,84 +596,56 @@ def _rgb_to_hsv_batch(rgb: Tensor) -> Tensor:
     """Convert batch of RGB images to HSV color space. All channels in [0, 1]."""
     r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
     
-    maxc = torch.max(rgb, dim=1)[0]
-    minc = torch.min(rgb, dim=1)[0]
-    rangec = maxc - minc
+    # H, S, V are written straight into their channels of one output buffer
+    hsv = torch.empty_like(rgb)
     
-    # Avoid division by zero
-    rangec_nz = torch.where(rangec > 1e-10, rangec, torch.ones_like(rangec))
-    
-    # Hue calculation (in [0, 1])
-    h = torch.zeros_like(maxc)
-    
-    mask_r = (maxc == r) & (rangec > 1e-10)
-    h[mask_r] = ((g[mask_r] - b[mask_r]) / rangec_nz[mask_r]) % 6.0
-    del mask_r
-    
-    mask_g = (maxc == g) & (rangec > 1e-10)
-    h[mask_g] = ((b[mask_g] - r[mask_g]) / rangec_nz[mask_g]) + 2.0
-    del mask_g
-    
-    mask_b = (maxc == b) & (rangec > 1e-10)
-    h[mask_b] = ((r[mask_b] - g[mask_b]) / rangec_nz[mask_b]) + 4.0
-    del mask_b
+    # Value calculation
+    maxc = torch.amax(rgb, dim=1, out=hsv[:, 2])
+    rangec = maxc - torch.amin(rgb, dim=1)
     
-    h.div_(6.0)  # Normalize to [0, 1] (in-place)
+    # Avoid division by zero
+    achromatic = rangec <= 1e-10
+    rangec_nz = rangec.masked_fill(achromatic, 1.0)
+    
+    # Hue calculation (in [0, 1]), branchless: when channels tie for the maximum,
+    # blue takes precedence over green, and green over red
+    torch.where(
+        maxc == b,
+        (r - g).div_(rangec_nz).add_(4.0),
+        torch.where(
+            maxc == g,
+            (b - r).div_(rangec_nz).add_(2.0),
+            torch.remainder((g - b).div_(rangec_nz), 6.0)
+        ),
+        out=hsv[:, 0]
+    )
+    hsv[:, 0].masked_fill_(achromatic, 0.0).div_(6.0)  # Normalize to [0, 1] (in-place)
+    del achromatic, rangec_nz
     
     # Saturation calculation
-    s = torch.where(maxc > 1e-10, rangec / torch.clamp(maxc, min=1e-10), torch.zeros_like(maxc))
-    del rangec, rangec_nz
-    
-    # Value calculation
-    v = maxc
+    torch.div(rangec, maxc.clamp(min=1e-10), out=hsv[:, 1]).masked_fill_(maxc <= 1e-10, 0.0)
+    del rangec
     
-    return torch.stack([h, s, v], dim=1)
+    return hsv
 
 
 def _hsv_to_rgb_batch(hsv: Tensor) -> Tensor:
     """Convert batch of HSV images to RGB color space."""
-    h = hsv[:, 0].mul(6.0)  # Convert to [0, 6]
-    s = hsv[:, 1]
-    v = hsv[:, 2]
-    
-    i = torch.floor(h).long() % 6
-    f = h - torch.floor(h)
-    
-    p = v * (1.0 - s)
-    q = v * (1.0 - s * f)
-    t = v * (1.0 - s * (1.0 - f))
-    
-    # Initialize RGB channels
-    r = torch.zeros_like(v)
-    g = torch.zeros_like(v)
-    b = torch.zeros_like(v)
-    
-    # Apply hue sector transformations
-    mask0 = (i == 0)
-    r[mask0], g[mask0], b[mask0] = v[mask0], t[mask0], p[mask0]
-    del mask0
+    h = hsv[:, 0:1].mul(6.0)  # Convert to [0, 6], keep channel dim for broadcasting
+    s = hsv[:, 1:2]
+    v = hsv[:, 2:3]
     
-    mask1 = (i == 1)
-    r[mask1], g[mask1], b[mask1] = q[mask1], v[mask1], p[mask1]
-    del mask1
+    # Branchless sector formula: channel n in (R, G, B) = (5, 3, 1) is
+    # v - v * s * clamp(min(k, 4 - k), 0, 1) with k = (n + 6h) mod 6,
+    # equivalent to the six-sector (p, q, t) lookup without per-sector masks
+    offsets = torch.tensor([5.0, 3.0, 1.0], dtype=hsv.dtype, device=hsv.device).view(1, 3, 1, 1)
     
-    mask2 = (i == 2)
-    r[mask2], g[mask2], b[mask2] = p[mask2], v[mask2], t[mask2]
-    del mask2
+    # Single [B, 3, H, W] buffer reused from k through to the RGB output
+    rgb = torch.add(h, offsets).remainder_(6.0)
+    del h
+    torch.minimum(rgb, 4.0 - rgb, out=rgb).clamp_(0.0, 1.0)
     
-    mask3 = (i == 3)
-    r[mask3], g[mask3], b[mask3] = p[mask3], q[mask3], v[mask3]
-    del mask3
-    
-    mask4 = (i == 4)
-    r[mask4], g[mask4], b[mask4] = t[mask4], p[mask4], v[mask4]
-    del mask4
-    
-    mask5 = (i == 5)
-    r[mask5], g[mask5], b[mask5] = v[mask5], p[mask5], q[mask5]
-    del mask5, i, f, p, q, t, h, s, v
-    
-    return torch.stack([r, g, b], dim=1)
+    return rgb.mul_(v * s).neg_().add_(v)
 
 
 def _hue_conditional_saturation_match(
@@ -711,42 +664,63 @@ def _hue_conditional_saturation_match(
     bin_width = 1.0 / num_bins
     min_pixels = 100  # Minimum pixels for reliable histogram matching
     
-    matched_s = content_s.clone()
     device = content_s.device
+    content_s_flat = content_s.flatten()
+    style_s_flat = style_s.flatten()
+    matched_s = content_s_flat.clone()
+    
+    # Group pixel indices by hue bin once per image: a stable sort keeps raster order
+    # within each bin, and a single bincount replaces the per-bin boolean masks
+    content_groups = _group_by_hue_bin(content_h.flatten(), num_bins, bin_width)
+    style_groups = _group_by_hue_bin(style_h.flatten(), num_bins, bin_width)
     
     for bin_idx in range(num_bins):
-        bin_start = bin_idx * bin_width
-        bin_end = (bin_idx + 1) * bin_width
+        content_idx = content_groups[bin_idx]
+        style_idx = style_groups[bin_idx]
         
-        # Handle hue wrap-around for red (0°/360°)
+        # Handle hue wrap-around for red (0°/360°): bin 0 also pools the last bin's
+        # pixels (which the last bin then overwrites with its own matching)
         if bin_idx == 0:
-            content_mask = ((content_h >= 0) & (content_h < bin_end)) | (content_h >= (1.0 - bin_width))
-            style_mask = ((style_h >= 0) & (style_h < bin_end)) | (style_h >= (1.0 - bin_width))
-        else:
-            content_mask = (content_h >= bin_start) & (content_h < bin_end)
-            style_mask = (style_h >= bin_start) & (style_h < bin_end)
-        
-        # Extract saturation values for this hue bin
-        content_s_bin = content_s[content_mask]
-        style_s_bin = style_s[style_mask]
+            content_idx = torch.cat([content_idx, content_groups[-1]]).sort().values
+            style_idx = torch.cat([style_idx, style_groups[-1]]).sort().values
         
         # Only match if both bins have sufficient pixels
-        if len(content_s_bin) > min_pixels and len(style_s_bin) > min_pixels:
-            matched_s_bin = _histogram_match_1d(content_s_bin, style_s_bin, device)
-            matched_s[content_mask] = matched_s_bin
-            del matched_s_bin
+        if len(content_idx) > min_pixels and len(style_idx) > min_pixels:
+            matched_s[content_idx] = _histogram_match_1d(content_s_flat[content_idx], style_s_flat[style_idx], device)
         
-        del content_mask, style_mask, content_s_bin, style_s_bin
+        del content_idx, style_idx
     
-    return matched_s
+    return matched_s.reshape(content_s.shape)
+
+
+def _group_by_hue_bin(hue: Tensor, num_bins: int, bin_width: float) -> list:
+    """
+    Split flat pixel indices into per-hue-bin index tensors (in raster order).
+    
+    Bin k holds hues in [k * bin_width, (k + 1) * bin_width), using the same
+    threshold comparisons as explicit range masks.
+    """
+    boundaries = torch.tensor([k * bin_width for k in range(1, num_bins)], dtype=hue.dtype, device=hue.device)
+    bins = torch.bucketize(hue, boundaries, right=True)
+    order = torch.argsort(bins, stable=True)
+    counts = torch.bincount(bins, minlength=num_bins).tolist()
+    return list(torch.split(order, counts))
+
+
+# Above this many values, histogram matching works from strided subsamples
+_HIST_MATCH_MAX_SAMPLES = 1 << 20
 
 
 def _histogram_match_1d(source: Tensor, reference: Tensor, device: torch.device) -> Tensor:
     """Match 1D histogram using CDF mapping."""
-    source_sorted, source_indices = torch.sort(source)
+    if source.numel() > _HIST_MATCH_MAX_SAMPLES:
+        return _histogram_match_sampled(source, reference)
+    
+    # Only the source permutation is needed: its sorted values are never used
+    source_indices = torch.argsort(source)
     reference_sorted, _ = torch.sort(reference)
     
-    n_source = len(source_sorted)
+    n_source = len(source_indices)
     n_reference = len(reference_sorted)
     
     if n_source == n_reference:
@@ -758,17 +732,71 @@ def _histogram_match_1d(source: Tensor, reference: Tensor, device: torch.device)
         matched_sorted = reference_sorted[ref_indices]
         del source_quantiles, ref_indices, reference_sorted
     
-    del source_sorted
+    if source.is_cuda and torch.version.hip is None:
+        # NVIDIA CUDA: undo the sort with an O(N) scatter instead of a second argsort
+        matched = torch.empty_like(matched_sorted)
+        matched[source_indices] = matched_sorted
+    else:
+        # Reconstruct using argsort (portable across CUDA/ROCm/MPS)
+        matched = matched_sorted[torch.argsort(source_indices)]
+    del source_indices, matched_sorted
+    
+    return matched
+
+
+def _histogram_match_sampled(source: Tensor, reference: Tensor) -> Tensor:
+    """
+    Approximate CDF mapping for large inputs.
+    
+    Both CDFs are estimated from ~_HIST_MATCH_MAX_SAMPLES strided samples and
+    folded into a (n_source + 1)-entry lookup table, so every source value is
+    matched with one int32 searchsorted plus one gather. This replaces the
+    full-size argsort/sort pair and the N-length int64 permutation; at 2^20
+    samples the quantile error is far below one output code value.
     
-    # Reconstruct using argsort (portable across CUDA/ROCm/MPS)
-    inverse_indices = torch.argsort(source_indices)
-    del source_indices
-    matched = matched_sorted[inverse_indices]
-    del matched_sorted, inverse_indices
+    Args:
+        source: Source values, flat [N] or spatial [..., H, W]
+        reference: Reference values, flat [M] or spatial [..., H, W]
+        
+    Returns:
+        Matched values with the same shape as source
+    """
+    source_sorted, _ = torch.sort(_strided_sample(source).flatten())
+    reference_sorted, _ = torch.sort(_strided_sample(reference).flatten())
+    n_source = source_sorted.numel()
+    n_reference = reference_sorted.numel()
+    
+    # Source rank r in [0, n_source] -> reference value at r * (n_reference - 1) // n_source
+    lut_indices = torch.arange(n_source + 1, device=source.device).mul_(n_reference - 1).div_(n_source, rounding_mode='floor')
+    lut = reference_sorted[lut_indices]
+    del lut_indices, reference_sorted
+    
+    if source.is_contiguous() or source.dim() < 3:
+        ranks = torch.searchsorted(source_sorted, source, out_int32=True)
+        matched = lut[ranks]
+        del ranks
+    else:
+        # Channel views of a multi-frame batch are only contiguous per frame:
+        # map frame by frame so searchsorted never makes a full-size copy
+        matched = torch.empty(source.shape, dtype=lut.dtype, device=lut.device)
+        for frame_src, frame_dst in zip(source, matched):
+            ranks = torch.searchsorted(source_sorted, frame_src, out_int32=True)
+            torch.index_select(lut, 0, ranks.flatten(), out=frame_dst.view(-1))
+            del ranks
+    del source_sorted, lut
     
     return matched
 
 
+def _strided_sample(values: Tensor) -> Tensor:
+    """Strided view of ~_HIST_MATCH_MAX_SAMPLES values (spatial grid for [..., H, W] inputs)."""
+    if values.dim() >= 2:
+        step = max(1, math.ceil(math.sqrt(values.numel() / _HIST_MATCH_MAX_SAMPLES)))
+        return values[..., ::step, ::step]
+    return values[::max(1, values.numel() // _HIST_MATCH_MAX_SAMPLES)]
+
+
+@torch.no_grad()
 def wavelet_adaptive_color_correction(content_feat: Tensor, style_feat: Tensor, debug: Optional['Debug'] = None) -> Tensor:
     """
     Adaptive hybrid color correction combining wavelet and HSV methods.
@@ -791,6 +819,10 @@ def wavelet_adaptive_color_correction(content_feat: Tensor, style_feat: Tensor,
     Returns:
         Adaptively corrected tensor [B, C, H, W] in [-1, 1]
     """
+    # Convert to float32 for processing (before resizing the low-resolution style)
+    content_feat, original_dtype = ensure_float32_precision(content_feat)
+    style_feat, _ = ensure_float32_precision(style_feat)
+    
     # Handle spatial dimension mismatch
     if content_feat.shape != style_feat.shape:
         debug.log(
@@ -804,19 +836,16 @@ def wavelet_adaptive_color_correction(content_feat: Tensor, style_feat: Tensor,
             align_corners=False
         )
     
-    # Convert to float32 for processing
-    content_feat, original_dtype = ensure_float32_precision(content_feat)
-    style_feat, _ = ensure_float32_precision(style_feat)
-    
     # Step 1: Apply wavelet (base correction)
     wavelet_result = wavelet_reconstruction(content_feat, style_feat, debug)
     
-    # Step 2: Apply HSV saturation matching (targeted correction)
-    hsv_result = hsv_saturation_histogram_match(content_feat, style_feat, debug)
+    # Step 2: Apply HSV saturation matching (targeted correction); it already computes
+    # the content and style saturation maps, so reuse them instead of recomputing
+    hsv_result, content_sat, style_sat = hsv_saturation_histogram_match(
+        content_feat, style_feat, debug, return_saturation=True
+    )
     
-    # Step 3: Compute saturation maps to detect oversaturation
-    content_sat = _get_saturation_map(content_feat)
-    style_sat = _get_saturation_map(style_feat)
+    # Step 3: Compute the remaining saturation map to detect oversaturation
     wavelet_sat = _get_saturation_map(wavelet_result)
     
     # Step 4: Create adaptive blend mask based on saturation difference
@@ -842,16 +871,16 @@ def wavelet_adaptive_color_correction(content_feat: Tensor, style_feat: Tensor,
     # Step 5: Adaptive blending (in-place where possible)
     result = wavelet_result.mul(1.0 - blend_weight).add_(hsv_result.mul(blend_weight))
     
-    # Log statistics
-    correction_pct = (blend_weight > 0.01).float().mean().item() * 100
+    # Log statistics (only when debug is on: .item() forces a device sync)
+    if debug.enabled:
+        correction_pct = (blend_weight > 0.01).float().mean().item() * 100
+        debug.log(f"Wavelet Adaptive: {correction_pct:.1f}% pixels use HSV correction", category="video", indent_level=1)
     del blend_weight, wavelet_result, hsv_result
     
     # Restore original dtype
     if result.dtype != original_dtype:
         result = result.to(original_dtype)
     
-    debug.log(f"Wavelet Adaptive: {correction_pct:.1f}% pixels use HSV correction", category="video", indent_level=1)
-    
     return result
 
 
@@ -100,6 +100,8 @@ class Debug:
         self.phase_vram_peaks_alloc: Dict[str, float] = {}
         self.phase_vram_peaks_rsv: Dict[str, float] = {}
         self.phase_ram_peaks: Dict[str, float] = {}
+        # NVTX ranges mirroring active timers, so Nsight timelines show pipeline stages
+        self.nvtx_ranges: Dict[str, int] = {}
         
     @torch._dynamo.disable  # Skip tracing to avoid datetime.now() warnings
     def log(self, message: str, level: str = "INFO", category: str = "general", force: bool = False, indent_level: int = 0) -> None:
@@ -279,6 +281,14 @@ class Debug:
 
             self.timers[name] = time.time()
             
+            # Mirror debug timers as NVTX ranges (start/end pairs, so timers may end out of order)
+            if self.enabled and is_cuda_available():
+                # A restarted timer closes its previous range first, so no range is left open
+                previous_range = self.nvtx_ranges.pop(name, None)
+                if previous_range is not None:
+                    torch.cuda.nvtx.range_end(previous_range)
+                self.nvtx_ranges[name] = torch.cuda.nvtx.range_start(name)
+            
             # Track phase for memory peak monitoring
             if name.startswith("phase") and name.endswith(("_encoding", "_upscaling", "_decoding", "_postprocessing")):
                 # Extract phase number (e.g., "phase3_decoding" -> "3")
@@ -323,6 +333,9 @@ class Debug:
             return 0.0
         
         duration = time.time() - self.timers[name]
+        range_id = self.nvtx_ranges.pop(name, None)
+        if range_id is not None:
+            torch.cuda.nvtx.range_end(range_id)
         self.timer_durations[name] = duration
         # Store the message for later use in summary
         if message:
@@ -787,6 +800,9 @@ class Debug:
     def clear_history(self) -> None:
         """Clear all history tracking"""
         self.timers.clear()
+        for range_id in self.nvtx_ranges.values():
+            torch.cuda.nvtx.range_end(range_id)
+        self.nvtx_ranges.clear()
         self.memory_checkpoints.clear()
         self.swap_times.clear()
         self.vram_history.clear()